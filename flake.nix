@@ -18,6 +18,8 @@
         devShell = pkgs.mkShell {
           buildInputs = with pkgs; [
             python313Packages.pygame
+            python313Packages.numpy
+            python313Packages.pytest
           ];
 
           shellHook = ''
@@ -5,48 +5,198 @@ A fast-paced arcade game where players must click on zombies before they escape.
 Features combo scoring, increasing difficulty, and retro-style graphics.
 """
 
-import pygame
+import time
 
-import src.const as const
-from src.game import Game
-from src.soundtrack import SoundManager
-from src.texture import TextureManager
+# Taken before the remaining imports so the startup report can time them
+IMPORT_START = time.perf_counter()
+
+import argparse  # noqa: E402
+import sys  # noqa: E402
+
+import pygame  # noqa: E402
+
+import src.const as const  # noqa: E402
+from src.arcade import Arcade  # noqa: E402
+from src.assets import AssetCache  # noqa: E402
+from src.board import Board  # noqa: E402
+from src.capture import FrameRecorder  # noqa: E402
+from src.game import Game  # noqa: E402
+from src.soundtrack import SoundManager  # noqa: E402
+from src.startup import startup_timer  # noqa: E402
+from src.texture import TextureManager  # noqa: E402
 
 
 def initialize_pygame():
-    """Initialize pygame and mixer."""
-    pygame.init()
-    pygame.mixer.init()
+    """Initialize the display subsystem (which brings up events) and clock.
 
+    pygame.time.get_ticks() returns 0 until the clock is started by a wait
+    or a Clock, so start it here rather than relying on the game loop's
+    first tick. Fonts and the mixer are initialized on first use by their
+    managers.
+    """
+    pygame.display.init()
+    pygame.time.wait(0)
 
-def create_display():
+
+def create_display(size=(const.WIDTH, const.HEIGHT)):
     """Create and configure the game window."""
-    screen = pygame.display.set_mode((const.WIDTH, const.HEIGHT))
+    screen = pygame.display.set_mode(size)
     pygame.display.set_caption("Whack-a-Zombie")
     return screen
 
 
 def load_assets():
-    """Load all game assets (textures and sounds)."""
+    """Load textures; sounds are loaded once the first frame is shown."""
     print("Loading game assets...")
 
     textures = TextureManager()
-    textures.load()
+    with startup_timer.phase("texture load"):
+        textures.load()
 
     sounds = SoundManager()
-    sounds.load()
 
     print("Assets loaded. Starting game...")
     return textures, sounds
 
 
+def parse_grid_size(value):
+    """Parse a COLUMNSxROWS size."""
+    try:
+        columns, rows = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COLUMNSxROWS, got {value!r}")
+    if columns < 1 or rows < 1:
+        raise argparse.ArgumentTypeError("size needs at least one column and row")
+    return columns, rows
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Whack-a-Zombie")
+    parser.add_argument(
+        "--capture",
+        action="store_true",
+        help="keep recent frames; dump them with F12 or on game over",
+    )
+    parser.add_argument(
+        "--capture-seconds",
+        type=int,
+        default=const.CAPTURE_SECONDS,
+        help="seconds of gameplay kept for capture dumps",
+    )
+    parser.add_argument(
+        "--capture-mb",
+        type=int,
+        default=const.CAPTURE_MAX_MB,
+        help="memory limit (MB) of the capture ring, which caps the seconds kept",
+    )
+    parser.add_argument(
+        "--capture-dir",
+        default=const.CAPTURE_DIR,
+        help="directory capture dumps are written to",
+    )
+    parser.add_argument(
+        "--board",
+        type=parse_grid_size,
+        help="play on a generated COLUMNSxROWS board (scroll with arrow keys)",
+    )
+    parser.add_argument(
+        "--board-seed",
+        type=int,
+        help="seed for generated board layout",
+    )
+    parser.add_argument(
+        "--wall",
+        type=parse_grid_size,
+        help="run COLUMNSxROWS game instances side by side in one window",
+    )
+    parser.add_argument(
+        "--stats-file",
+        help="merge each game's reaction times into this file at game over",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print a startup time breakdown after the first frame and exit",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=const.FIRST_FRAME_BUDGET_MS,
+        help="time-to-first-frame budget (ms) checked by --startup-report",
+    )
+    args = parser.parse_args()
+    if args.wall and args.capture:
+        parser.error("--capture records a single game and cannot be used with --wall")
+    return args
+
+
+def create_wall(wall_size, board, stats_path):
+    """Create a grid of game instances sharing one window and one asset cache."""
+    columns, rows = wall_size
+    with startup_timer.phase("display creation"):
+        display = create_display((columns * const.WIDTH, rows * const.HEIGHT))
+
+    print("Loading game assets...")
+    arcade = Arcade(display, AssetCache())
+    for row in range(rows):
+        for column in range(columns):
+            viewport = (
+                column * const.WIDTH,
+                row * const.HEIGHT,
+                const.WIDTH,
+                const.HEIGHT,
+            )
+            arcade.add_instance(viewport, board, stats_path)
+    print(f"Assets loaded. Starting {columns * rows} games...")
+    return arcade
+
+
+def report_startup(budget_ms):
+    """Print the startup report and exit, failing if over budget."""
+    pygame.quit()
+    print(startup_timer.format_report(budget_ms))
+    sys.exit(1 if startup_timer.is_over_budget(budget_ms) else 0)
+
+
 def main():
     """Main entry point for the game."""
-    initialize_pygame()
-    screen = create_display()
+    startup_timer.set_origin(IMPORT_START)
+    startup_timer.add("imports", time.perf_counter() - IMPORT_START)
+    args = parse_args()
+
+    with startup_timer.phase("subsystem init"):
+        initialize_pygame()
+
+    board = None
+    if args.board:
+        columns, rows = args.board
+        board = Board.generate(columns, rows, args.board_seed)
+
+    if args.wall:
+        arcade = create_wall(args.wall, board, args.stats_file)
+        if args.startup_report:
+            arcade.start()
+            report_startup(args.startup_budget)
+        arcade.run()
+        return
+
+    with startup_timer.phase("display creation"):
+        screen = create_display()
     textures, sounds = load_assets()
 
-    game = Game(screen, textures, sounds)
+    recorder = None
+    if args.capture:
+        recorder = FrameRecorder(
+            screen, args.capture_dir, args.capture_seconds, max_mb=args.capture_mb
+        )
+
+    game = Game(screen, textures, sounds, recorder, board, args.stats_file)
+
+    if args.startup_report:
+        game.start()
+        report_startup(args.startup_budget)
+
     game.run()
 
 
@@ -0,0 +1,409 @@
+"""Streaming reaction-time analytics with bounded memory.
+
+Reaction times are summarized with an online mean/variance and a merging
+t-digest quantile sketch, so memory stays fixed however long a session
+runs, and sketches from many sessions can be merged and queried together.
+
+    python -m src.analytics reaction_stats.json
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writers may race
+    fcntl = None
+
+from . import const
+
+
+class RunningStats:
+    """Online count, mean, variance, min and max (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        """Add one sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """Merge another RunningStats into this one (Chan et al.)."""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def get_variance(self):
+        """Get sample variance (0 with fewer than two samples)."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def get_stddev(self):
+        """Get sample standard deviation."""
+        return math.sqrt(self.get_variance())
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.count = data["count"]
+        stats.mean = data["mean"]
+        stats.m2 = data["m2"]
+        if stats.count:
+            stats.min = data["min"]
+            stats.max = data["max"]
+        return stats
+
+
+class QuantileSketch:
+    """Merging t-digest quantile sketch.
+
+    Samples are buffered and periodically merged into weighted centroids.
+    Each centroid may span at most one unit of the k1 scale function
+    k(q) = compression / (2 * pi) * asin(2q - 1), which is steep near q = 0
+    and q = 1, so the tails stay precise while the number of centroids stays
+    below compression no matter how many samples are added.
+    """
+
+    def __init__(self, compression=const.SKETCH_COMPRESSION):
+        self.compression = compression
+        self.means = []
+        self.weights = []
+        self.buffer = []
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        """Add one sample."""
+        self.buffer.append(value)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.buffer) >= self.compression * const.SKETCH_BUFFER_FACTOR:
+            self._compress()
+
+    def merge(self, other):
+        """Merge another sketch into this one."""
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        points = list(zip(other.means, other.weights))
+        points.extend((value, 1) for value in other.buffer)
+        self._compress(points)
+
+    def get_quantile(self, q):
+        """Estimate the q-quantile (0..1), or None without samples."""
+        self._compress()
+        if not self.means:
+            return None
+
+        total = sum(self.weights)
+        target = q * total
+
+        # Interpolate between centroid centers, anchored at min and max
+        prev_position = 0.0
+        prev_mean = self.min
+        cumulative = 0.0
+        for mean, weight in zip(self.means, self.weights):
+            position = cumulative + weight / 2
+            if target < position:
+                return self._interpolate(
+                    target, prev_position, prev_mean, position, mean
+                )
+            prev_position = position
+            prev_mean = mean
+            cumulative += weight
+
+        return self._interpolate(target, prev_position, prev_mean, total, self.max)
+
+    def to_dict(self):
+        self._compress()
+        return {
+            "compression": self.compression,
+            "means": self.means,
+            "weights": self.weights,
+            "min": self.min if self.means else None,
+            "max": self.max if self.means else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["compression"])
+        sketch.means = list(data["means"])
+        sketch.weights = list(data["weights"])
+        if sketch.means:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    @staticmethod
+    def _interpolate(target, left_position, left_value, right_position, right_value):
+        if right_position <= left_position:
+            return right_value
+        fraction = (target - left_position) / (right_position - left_position)
+        return left_value + fraction * (right_value - left_value)
+
+    def _get_q_limit(self, q):
+        """Get the highest quantile a centroid starting at q may reach."""
+        scale = self.compression / (2 * math.pi)
+        k = scale * math.asin(min(1.0, 2 * q - 1)) + 1
+        if k >= scale * math.pi / 2:
+            return 1.0
+        return (math.sin(k / scale) + 1) / 2
+
+    def _compress(self, extra=()):
+        """Merge buffered samples (and extra centroids) into the centroids."""
+        if not self.buffer and not extra:
+            return
+
+        points = list(zip(self.means, self.weights))
+        points.extend((value, 1) for value in self.buffer)
+        points.extend(extra)
+        points.sort()
+        self.buffer.clear()
+
+        total = sum(weight for _, weight in points)
+        means = []
+        weights = []
+        current_mean, current_weight = points[0]
+        cumulative = 0.0
+        q_limit = self._get_q_limit(0.0)
+
+        for mean, weight in points[1:]:
+            if cumulative + current_weight + weight <= q_limit * total:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                cumulative += current_weight
+                q_limit = self._get_q_limit(cumulative / total)
+                current_mean, current_weight = mean, weight
+
+        means.append(current_mean)
+        weights.append(current_weight)
+        self.means = means
+        self.weights = weights
+
+
+class Distribution:
+    """Moments plus quantile sketch of one stream of samples."""
+
+    def __init__(self):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        """Add one sample."""
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other):
+        """Merge another Distribution into this one."""
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def get_percentiles(self, percentiles):
+        """Estimate the given percentiles (0..100)."""
+        return [self.sketch.get_quantile(p / 100) for p in percentiles]
+
+    def to_dict(self):
+        return {"stats": self.stats.to_dict(), "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        distribution = cls()
+        distribution.stats = RunningStats.from_dict(data["stats"])
+        distribution.sketch = QuantileSketch.from_dict(data["sketch"])
+        return distribution
+
+
+class ReactionStats:
+    """Reaction times (hit time minus spawn time) overall, by level and by hole.
+
+    Levels above ANALYTICS_MAX_LEVEL share one bucket, so endless sessions
+    don't grow the per-level table. Holes keep moments only, so large boards
+    stay cheap.
+    """
+
+    def __init__(self):
+        self.overall = Distribution()
+        self.by_level = {}
+        self.by_hole = {}
+
+    def add(self, reaction_time, level, hole_index):
+        """Record one hit."""
+        self.overall.add(reaction_time)
+
+        level = min(level, const.ANALYTICS_MAX_LEVEL)
+        if level not in self.by_level:
+            self.by_level[level] = Distribution()
+        self.by_level[level].add(reaction_time)
+
+        if hole_index not in self.by_hole:
+            self.by_hole[hole_index] = RunningStats()
+        self.by_hole[hole_index].add(reaction_time)
+
+    def merge(self, other):
+        """Merge another session's stats into this one."""
+        self.overall.merge(other.overall)
+        for level, distribution in other.by_level.items():
+            self.by_level.setdefault(level, Distribution()).merge(distribution)
+        for hole_index, stats in other.by_hole.items():
+            self.by_hole.setdefault(hole_index, RunningStats()).merge(stats)
+
+    def get_percentiles(self, percentiles=const.ANALYTICS_PERCENTILES):
+        """Estimate overall reaction time percentiles (ms)."""
+        return self.overall.get_percentiles(percentiles)
+
+    def to_dict(self):
+        return {
+            "overall": self.overall.to_dict(),
+            "by_level": {
+                str(level): distribution.to_dict()
+                for level, distribution in self.by_level.items()
+            },
+            "by_hole": {
+                str(hole_index): stats.to_dict()
+                for hole_index, stats in self.by_hole.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        reactions = cls()
+        reactions.overall = Distribution.from_dict(data["overall"])
+        reactions.by_level = {
+            int(level): Distribution.from_dict(distribution)
+            for level, distribution in data["by_level"].items()
+        }
+        reactions.by_hole = {
+            int(hole_index): RunningStats.from_dict(stats)
+            for hole_index, stats in data["by_hole"].items()
+        }
+        return reactions
+
+
+def load_stats(path):
+    """Load cumulative stats from path (empty stats if it doesn't exist)."""
+    if not os.path.exists(path):
+        return ReactionStats()
+    with open(path) as f:
+        return ReactionStats.from_dict(json.load(f))
+
+
+def record_session(path, reactions):
+    """Merge a session's stats into the cumulative stats file at path.
+
+    Processes sharing the file (one per screen) take turns through an
+    advisory lock, and the file is replaced atomically through a uniquely
+    named temporary file, so sessions finishing together are all kept and
+    readers never see a partial file. Unreadable or corrupt files are
+    reported and left untouched rather than raised into the game loop.
+
+    Returns:
+        bool: True if the session was recorded
+    """
+    try:
+        with _lock_stats(path):
+            return _merge_into(path, reactions)
+    except OSError as e:
+        print(f"Warning: couldn't lock reaction stats file {path}: {e}")
+        return False
+
+
+@contextmanager
+def _lock_stats(path):
+    """Hold an exclusive lock on path's lock file (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _merge_into(path, reactions):
+    """Merge reactions into the stats file at path (caller holds the lock)."""
+    try:
+        totals = load_stats(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Warning: not recording reaction stats, can't read {path}: {e}")
+        return False
+    totals.merge(reactions)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = None
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(path), suffix=".tmp", dir=directory
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(totals.to_dict(), f)
+        os.replace(temp_path, path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: couldn't write reaction stats to {path}: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+    return True
+
+
+def format_percentiles(distribution, percentiles=const.ANALYTICS_PERCENTILES):
+    """Format count, mean/stddev and percentiles of a distribution."""
+    stats = distribution.stats
+    values = distribution.get_percentiles(percentiles)
+    parts = [f"n={stats.count}", f"mean={stats.mean:.0f}±{stats.get_stddev():.0f}"]
+    parts.extend(f"p{p}={value:.0f}" for p, value in zip(percentiles, values))
+    return " ".join(parts)
+
+
+def main():
+    """Print reaction time percentiles from one or more stats files."""
+    paths = sys.argv[1:] or [const.ANALYTICS_FILE]
+    totals = ReactionStats()
+    for path in paths:
+        totals.merge(load_stats(path))
+
+    if totals.overall.stats.count == 0:
+        print("No reaction times recorded.")
+        return
+
+    print(f"Overall   {format_percentiles(totals.overall)}")
+    for level in sorted(totals.by_level):
+        label = f"{level}+" if level == const.ANALYTICS_MAX_LEVEL else str(level)
+        print(f"Level {label:<4}{format_percentiles(totals.by_level[level])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Several game instances in one window."""
+
+import pygame
+
+from . import const
+from .assets import EFFECTS, FONTS, SOUNDS, TEXTURES
+from .game import Game
+from .quality import QualityGovernor
+from .startup import startup_timer
+
+
+class Arcade:
+    """Runs several Game instances, each in its own viewport of one display.
+
+    Instances draw into subsurfaces of the display and share assets through
+    an AssetCache. A single loop ticks them all, so they share one clock,
+    one event poll and one display flip, and one QualityGovernor judges the
+    whole frame and sets every instance's quality. Pointer events go to the viewport
+    they land in, translated to viewport coordinates; key presses go to the
+    instance that last received a pointer event, and key releases go to
+    every instance so no held key is left stuck when focus moves.
+    """
+
+    def __init__(self, display, assets):
+        self.display = display
+        self.assets = assets
+        self.clock = pygame.time.Clock()
+        self.quality = QualityGovernor()
+        self.games = []
+        self.viewports = []
+        self.focus = 0
+
+    def add_instance(self, viewport, board=None, stats_path=None):
+        """Create a game drawing into viewport (a Rect of the display).
+
+        Viewports must be the game's native size: fonts, the HUD layout and
+        the classic board backdrop are all made for WIDTH x HEIGHT.
+        """
+        viewport = pygame.Rect(viewport)
+        if viewport.size != (const.WIDTH, const.HEIGHT):
+            raise ValueError(
+                f"viewport must be {const.WIDTH}x{const.HEIGHT}, got "
+                f"{viewport.width}x{viewport.height}"
+            )
+        game = Game(
+            self.display.subsurface(viewport),
+            self.assets.acquire(TEXTURES),
+            self.assets.acquire(SOUNDS),
+            board=board,
+            stats_path=stats_path,
+            fonts=self.assets.acquire(FONTS),
+            effect_sprites=self.assets.acquire(EFFECTS),
+        )
+        game.apply_quality(self.quality.get_settings())
+        self.games.append(game)
+        self.viewports.append(viewport)
+        return game
+
+    def remove_instance(self, game):
+        """Remove a game and release its assets."""
+        index = self.games.index(game)
+        del self.games[index]
+        del self.viewports[index]
+        self.focus = min(self.focus, max(0, len(self.games) - 1))
+
+        for key in (TEXTURES, SOUNDS, FONTS, EFFECTS):
+            self.assets.release(key)
+
+    def start(self):
+        """Present every instance's first frame, then load shared audio and sprites."""
+        for game in self.games:
+            game.running = True
+            game.draw()
+        pygame.display.flip()
+        startup_timer.mark_first_frame()
+        if self.games:
+            self.games[0].soundtracks.play_music()
+            self.games[0].effects.sprites.load()
+
+    def run(self):
+        """Main loop for all instances; ends when every instance has quit."""
+        self.start()
+
+        while any(game.running for game in self.games):
+            frame_time = self.clock.tick(60)
+
+            # Work time of the last frame (all instances), excluding the wait
+            if self.quality.add_frame(self.clock.get_rawtime()):
+                settings = self.quality.get_settings()
+                for game in self.games:
+                    game.apply_quality(settings)
+
+            routed = self._route_events(pygame.event.get())
+            for game, events in zip(self.games, routed):
+                if game.running:
+                    game.step(frame_time, events)
+
+            pygame.display.flip()
+
+        for game in self.games:
+            game.finish()
+        pygame.quit()
+
+    def _route_events(self, events):
+        """Split events into one list per instance."""
+        routed = [[] for _ in self.games]
+        width, height = self.display.get_size()
+
+        for event in events:
+            if event.type in (pygame.QUIT, pygame.KEYUP):
+                for game_events in routed:
+                    game_events.append(event)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                index = self._find_viewport(event.pos)
+                if index is None:
+                    continue
+                self.focus = index
+                x, y = self.viewports[index].topleft
+                routed[index].append(
+                    pygame.event.Event(
+                        event.type,
+                        button=event.button,
+                        pos=(event.pos[0] - x, event.pos[1] - y),
+                        touch=getattr(event, "touch", False),
+                    )
+                )
+
+            elif event.type == pygame.FINGERDOWN:
+                # Touch positions are normalized to the whole display
+                pos = (event.x * width, event.y * height)
+                index = self._find_viewport(pos)
+                if index is None:
+                    continue
+                self.focus = index
+                viewport = self.viewports[index]
+                routed[index].append(
+                    pygame.event.Event(
+                        event.type,
+                        touch_id=event.touch_id,
+                        finger_id=event.finger_id,
+                        x=(pos[0] - viewport.x) / viewport.width,
+                        y=(pos[1] - viewport.y) / viewport.height,
+                    )
+                )
+
+            elif routed:
+                routed[self.focus].append(event)
+
+        return routed
+
+    def _find_viewport(self, pos):
+        """Get index of the viewport containing pos, or None."""
+        for i, viewport in enumerate(self.viewports):
+            if viewport.collidepoint(pos):
+                return i
+        return None
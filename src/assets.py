@@ -0,0 +1,75 @@
+"""Asset cache shared between game instances."""
+
+from .effects import EffectSprites
+from .font import FontManager
+from .soundtrack import SoundManager
+from .startup import startup_timer
+from .texture import TextureManager
+
+TEXTURES = "textures"
+FONTS = "fonts"
+SOUNDS = "sounds"
+EFFECTS = "effects"
+
+
+def load_textures():
+    """Create and load a TextureManager."""
+    textures = TextureManager()
+    with startup_timer.phase("texture load"):
+        textures.load()
+    return textures
+
+
+# Fonts, sounds and effect sprites load lazily on first use
+LOADERS = {
+    TEXTURES: load_textures,
+    FONTS: FontManager,
+    SOUNDS: SoundManager,
+    EFFECTS: EffectSprites,
+}
+
+# Assets built from other assets, which their loader receives as arguments
+DEPENDENCIES = {
+    EFFECTS: (FONTS,),
+}
+
+
+class AssetCache:
+    """Reference-counted cache of loaded assets.
+
+    Each asset is loaded on its first acquire and dropped when the last
+    holder releases it. Holders share the same objects and must treat them
+    as read-only (games only ever blit textures and render with fonts).
+    A loaded asset holds a reference to each of its dependencies.
+    """
+
+    def __init__(self, loaders=None, dependencies=None):
+        self.loaders = loaders or LOADERS
+        self.dependencies = DEPENDENCIES if dependencies is None else dependencies
+        self.assets = {}
+        self.refcounts = {}
+
+    def acquire(self, key):
+        """Get an asset, loading it if nobody holds it yet."""
+        if key not in self.assets:
+            requirements = [
+                self.acquire(dependency)
+                for dependency in self.dependencies.get(key, ())
+            ]
+            self.assets[key] = self.loaders[key](*requirements)
+            self.refcounts[key] = 0
+        self.refcounts[key] += 1
+        return self.assets[key]
+
+    def release(self, key):
+        """Drop one reference to an asset, unloading it after the last one."""
+        self.refcounts[key] -= 1
+        if self.refcounts[key] == 0:
+            del self.assets[key]
+            del self.refcounts[key]
+            for dependency in self.dependencies.get(key, ()):
+                self.release(dependency)
+
+    def get_refcount(self, key):
+        """Get number of holders of an asset."""
+        return self.refcounts.get(key, 0)
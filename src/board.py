@@ -0,0 +1,87 @@
+"""Board layouts and spatial indexing of holes."""
+
+import random
+
+from . import const
+
+
+class Board:
+    """Hole positions in world coordinates, indexed by square chunks.
+
+    Holes are bucketed into chunks of chunk_size pixels, so the holes near a
+    viewport are found by visiting only the chunks it overlaps, however
+    large the board is.
+    """
+
+    def __init__(self, positions, width, height, has_backdrop=False, chunk_size=None):
+        self.positions = list(positions)
+        self.width = width
+        self.height = height
+        self.has_backdrop = has_backdrop
+        self.chunk_size = chunk_size or const.BOARD_CHUNK_SIZE
+
+        self.chunks = {}
+        for i, (x, y) in enumerate(self.positions):
+            key = (x // self.chunk_size, y // self.chunk_size)
+            self.chunks.setdefault(key, []).append(i)
+
+    def __len__(self):
+        return len(self.positions)
+
+    @classmethod
+    def classic(cls):
+        """The original single-screen 20-hole board drawn by the backdrop."""
+        return cls(const.GRID_POSITIONS, const.WIDTH, const.HEIGHT, has_backdrop=True)
+
+    @classmethod
+    def generate(cls, columns, rows, seed=None):
+        """Generate a staggered board of columns x rows holes.
+
+        Odd rows are shifted by half a column like the classic board, and
+        each hole is jittered slightly so large boards don't look tiled.
+        """
+        rng = random.Random(seed)
+        jitter = const.BOARD_JITTER
+
+        positions = []
+        for row in range(rows):
+            offset = const.BOARD_SPACING_X // 2 if row % 2 else 0
+            y = const.BOARD_MARGIN_TOP + row * const.BOARD_SPACING_Y
+            for column in range(columns):
+                x = const.BOARD_MARGIN_X + offset + column * const.BOARD_SPACING_X
+                positions.append(
+                    (x + rng.randint(-jitter, jitter), y + rng.randint(-jitter, jitter))
+                )
+
+        width = (
+            2 * const.BOARD_MARGIN_X
+            + (columns - 1) * const.BOARD_SPACING_X
+            + const.BOARD_SPACING_X // 2
+        )
+        height = (
+            const.BOARD_MARGIN_TOP
+            + (rows - 1) * const.BOARD_SPACING_Y
+            + const.BOARD_MARGIN_BOTTOM
+        )
+        return cls(positions, width, height)
+
+    def get_holes_in_rect(self, rect, margin=0):
+        """Get sorted indices of holes in chunks overlapping rect.
+
+        The result may include holes just outside rect (chunk granularity);
+        callers needing exact containment filter it further.
+        """
+        size = self.chunk_size
+        left = (rect.left - margin) // size
+        right = (rect.right + margin) // size
+        top = (rect.top - margin) // size
+        bottom = (rect.bottom + margin) // size
+
+        holes = []
+        for chunk_y in range(top, bottom + 1):
+            for chunk_x in range(left, right + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk:
+                    holes.extend(chunk)
+        holes.sort()
+        return holes
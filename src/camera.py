@@ -0,0 +1,42 @@
+"""Scrolling camera over the board."""
+
+import pygame
+
+
+class Camera:
+    """Viewport into the board; screen = world - camera position."""
+
+    def __init__(self, viewport_size, world_size):
+        self.width, self.height = viewport_size
+        self.world_width, self.world_height = world_size
+        self.x = 0
+        self.y = 0
+
+    def move(self, dx, dy):
+        """Scroll by (dx, dy), staying within the board."""
+        max_x = max(0, self.world_width - self.width)
+        max_y = max(0, self.world_height - self.height)
+        self.x = min(max_x, max(0, self.x + dx))
+        self.y = min(max_y, max(0, self.y + dy))
+
+    def center_on(self, pos):
+        """Center the viewport on a world position."""
+        self.x = 0
+        self.y = 0
+        self.move(pos[0] - self.width // 2, pos[1] - self.height // 2)
+
+    def get_view_rect(self):
+        """Get the visible area in world coordinates."""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def get_offset(self):
+        """Get the (x, y) offset subtracted from world positions."""
+        return (self.x, self.y)
+
+    def world_to_screen(self, pos):
+        """Convert a world position to a screen position."""
+        return (pos[0] - self.x, pos[1] - self.y)
+
+    def screen_to_world(self, pos):
+        """Convert a screen position to a world position."""
+        return (pos[0] + self.x, pos[1] + self.y)
@@ -0,0 +1,154 @@
+"""Gameplay frame capture to a memory-mapped ring buffer."""
+
+import mmap
+import os
+import threading
+import time
+
+from . import const
+
+# Memory order of 32/24-bit pixels on a little-endian machine, keyed by
+# (bytes per pixel, red mask, blue mask), as ffmpeg rawvideo pixel formats
+PIXEL_FORMATS = {
+    (4, 0x00FF0000, 0x000000FF): "bgr0",
+    (4, 0x000000FF, 0x00FF0000): "rgb0",
+    (3, 0x00FF0000, 0x000000FF): "bgr24",
+    (3, 0x000000FF, 0x00FF0000): "rgb24",
+}
+
+
+class FrameRecorder:
+    """Keeps the last few seconds of presented frames for later export.
+
+    Each frame is copied straight from the surface's pixel buffer into a
+    preallocated anonymous memory map, without intermediate byte strings.
+    That copy is one memcpy per frame on the render thread (about 0.7 ms at
+    1280x720), since the screen is redrawn right after it is presented. The
+    ring is not backed by a file, so frames are never written back to disk
+    while playing and the copy can't be throttled by dirty-page writeback;
+    only dumps touch the disk. Dumps stream the ring out as raw video on a
+    background thread; frames presented while a dump is in progress are not
+    captured, so the ring is never overwritten while being read.
+
+    The ring is held in RAM, so it is capped at max_mb megabytes, keeping
+    fewer seconds than requested if needed.
+    """
+
+    def __init__(
+        self,
+        surface,
+        output_dir,
+        seconds=const.CAPTURE_SECONDS,
+        fps=60,
+        max_mb=const.CAPTURE_MAX_MB,
+    ):
+        self.width, self.height = surface.get_size()
+        self.pitch = surface.get_pitch()
+        self.row_bytes = self.width * surface.get_bytesize()
+        self.frame_bytes = self.pitch * self.height
+        self.fps = fps
+        max_frames = max(1, max_mb * 1024 * 1024 // self.frame_bytes)
+        self.capacity = min(seconds * fps, max_frames)
+        red_mask, _, blue_mask, _ = surface.get_masks()
+        self.pixel_format = PIXEL_FORMATS.get(
+            (surface.get_bytesize(), red_mask, blue_mask)
+        )
+        self.output_dir = output_dir
+
+        # Ring storage
+        # Private anonymous memory, faulted in up front where supported
+        # (MAP_POPULATE), so the first lap doesn't pay for page faults
+        ring_size = self.capacity * self.frame_bytes
+        if hasattr(mmap, "MAP_ANONYMOUS"):
+            flags = mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS
+            flags |= getattr(mmap, "MAP_POPULATE", 0)
+            self.ring = mmap.mmap(-1, ring_size, flags=flags)
+        else:
+            self.ring = mmap.mmap(-1, ring_size)
+        self.next_slot = 0
+        self.frame_count = 0
+
+        self.dump_thread = None
+
+        print(
+            f"Capture ring: {self.capacity / fps:.1f}s at {self.width}x{self.height}"
+            f" ({ring_size / (1024 * 1024):.0f} MB of memory)"
+        )
+        if self.capacity < seconds * fps:
+            print(f"  Capped from {seconds}s by the {max_mb} MB capture limit")
+
+    def capture(self, surface):
+        """Copy the presented frame into the ring."""
+        if self.is_dumping():
+            return
+
+        start = self.next_slot * self.frame_bytes
+        self.ring[start : start + self.frame_bytes] = surface.get_buffer()
+
+        self.next_slot = (self.next_slot + 1) % self.capacity
+        self.frame_count = min(self.capacity, self.frame_count + 1)
+
+    def is_dumping(self):
+        """Check if a dump is being written."""
+        return self.dump_thread is not None and self.dump_thread.is_alive()
+
+    def dump(self):
+        """Write buffered frames to a new raw video file in the background.
+
+        Returns:
+            str: Path being written, or None if there is nothing to write
+        """
+        if self.is_dumping() or self.frame_count == 0:
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, time.strftime("capture-%Y%m%d-%H%M%S.raw"))
+
+        first_slot = (self.next_slot - self.frame_count) % self.capacity
+        frame_count = self.frame_count
+        self.frame_count = 0
+
+        self.dump_thread = threading.Thread(
+            target=self._write_frames,
+            args=(path, first_slot, frame_count),
+            daemon=True,
+        )
+        self.dump_thread.start()
+
+        print(f"Writing {frame_count} frames to {path}")
+        print(f"  Encode with: {self.get_encoder_command(path)}")
+        return path
+
+    def get_encoder_command(self, path):
+        """Get an ffmpeg command line that encodes a dump."""
+        pixel_format = self.pixel_format or "<pixel format>"
+        return (
+            f"ffmpeg -f rawvideo -pixel_format {pixel_format} "
+            f"-video_size {self.width}x{self.height} -framerate {self.fps} "
+            f"-i {path} capture.mp4"
+        )
+
+    def close(self):
+        """Wait for any pending dump and release the ring."""
+        if self.dump_thread is not None:
+            self.dump_thread.join()
+        self.ring.close()
+
+    def _write_frames(self, path, first_slot, frame_count):
+        """Stream frames oldest-first to path, dropping row padding."""
+        view = memoryview(self.ring)
+        try:
+            with open(path, "wb") as out:
+                for i in range(frame_count):
+                    slot = (first_slot + i) % self.capacity
+                    start = slot * self.frame_bytes
+
+                    if self.pitch == self.row_bytes:
+                        out.write(view[start : start + self.frame_bytes])
+                        continue
+
+                    for row in range(self.height):
+                        row_start = start + row * self.pitch
+                        out.write(view[row_start : row_start + self.row_bytes])
+        finally:
+            view.release()
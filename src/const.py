@@ -32,6 +32,20 @@ for x in ROW_EVEN_X:
 for x in ROW_ODD_X:
     GRID_POSITIONS.append((x, ROW_Y_POSITIONS[2]))
 
+# Generated boards (same spacing as the classic grid)
+BOARD_SPACING_X = 180
+BOARD_SPACING_Y = 200
+BOARD_MARGIN_X = 90
+BOARD_MARGIN_TOP = 210  # Room for a full zombie above the first row
+BOARD_MARGIN_BOTTOM = 110
+BOARD_JITTER = 20  # Max random offset per hole (px)
+BOARD_CHUNK_SIZE = 512  # Spatial index chunk size (px)
+BOARD_CULL_MARGIN = 160  # Zombie sprite/timer bar reach around a hole (px)
+CAMERA_SPEED = 0.8  # Camera scroll speed (px/ms)
+GROUND_TILE_TOP = 245  # Hole-free strip of the backdrop used as ground tile
+GROUND_TILE_HEIGHT = 130
+HOLE_SIZE = (140, 52)  # Drawn hole size on generated boards
+
 # Difficulty settings
 SPAWN_INTERVAL_BASE = 1000  # Base time between zombie spawns (ms)
 SHOW_DURATION_BASE = 950  # Base time zombies stay visible (ms)
@@ -55,3 +69,93 @@ HIT_DISPLAY_DURATION = 2000  # How long squashed zombie shows (ms)
 
 # UI settings
 COMBO_DISPLAY_THRESHOLD = 3  # Minimum combo to show combo counter
+
+# Timer bar
+TIMER_BAR_WIDTH = 60
+TIMER_BAR_HEIGHT = 6
+TIMER_BAR_BG_COLOR = (40, 40, 40)
+TIMER_BAR_BORDER_COLOR = (200, 200, 200)
+TIMER_BAR_GREEN = (100, 255, 100)
+TIMER_BAR_YELLOW = (255, 200, 50)
+TIMER_BAR_RED = (255, 70, 70)
+
+# Hit effects
+PARTICLE_POOL_SIZE = 2048  # Max live splat particles
+POPUP_POOL_SIZE = 32  # Max live score pop-ups
+PARTICLES_PER_HIT = 24  # Splat particles per hit (before combo bonus)
+PARTICLES_PER_COMBO = 2  # Extra particles per combo step
+MAX_PARTICLES_PER_HIT = 64
+PARTICLE_LIFETIME = 600  # ms
+PARTICLE_MIN_SPEED = 0.10  # px/ms
+PARTICLE_MAX_SPEED = 0.45  # px/ms
+PARTICLE_GRAVITY = 0.0015  # px/ms^2
+PARTICLE_FADE_STEPS = 4  # Pre-rendered alpha levels per particle sprite
+POPUP_LIFETIME = 700  # ms
+POPUP_RISE_SPEED = 0.08  # px/ms
+POPUP_PRERENDER_MAX_POINTS = 50  # Pop-ups rendered at startup (combo 120)
+SHAKE_DURATION = 200  # ms
+SHAKE_MAX_MAGNITUDE = 8  # px
+
+# Frame capture
+CAPTURE_SECONDS = 4  # Seconds of gameplay kept in the capture ring
+CAPTURE_MAX_MB = 1024  # Ring memory limit (~4.8s at 1280x720, 60 fps)
+CAPTURE_DIR = "captures"  # Where capture dumps are written
+
+# Startup
+FIRST_FRAME_BUDGET_MS = 1500  # Time-to-first-frame budget for --startup-report
+
+# Reaction time analytics
+SKETCH_COMPRESSION = 100  # t-digest compression (~centroids kept)
+SKETCH_BUFFER_FACTOR = 5  # Samples buffered per unit of compression
+ANALYTICS_MAX_LEVEL = 20  # Higher levels share one bucket
+ANALYTICS_PERCENTILES = (50, 90, 99)
+ANALYTICS_FILE = "reaction_stats.json"  # Default cumulative stats file
+
+# Adaptive quality
+FRAME_BUDGET_MS = 1000 / 60  # Work time per frame before quality drops
+QUALITY_WINDOW = 30  # Frames averaged per decision
+QUALITY_DOWN_THRESHOLD = 0.95  # Step down above this fraction of the budget
+QUALITY_UP_THRESHOLD = 0.6  # Step up below this fraction of the budget
+QUALITY_UPGRADE_DELAY = 180  # Frames of headroom needed before stepping up
+QUALITY_MAX_UPGRADE_DELAY = 3600  # Cap for the doubling upgrade delay
+
+# No level lowers the internal resolution: frames are bound by blit count
+# rather than pixels, and upscaling a half-size playfield costs more than it
+# saves once particles are reduced.
+QUALITY_LEVELS = [
+    {
+        "name": "high",
+        "particle_scale": 1.0,
+        "screen_shake": True,
+        "text_antialias": True,
+        "timer_bars": True,
+    },
+    {
+        "name": "reduced effects",
+        "particle_scale": 0.5,
+        "screen_shake": True,
+        "text_antialias": True,
+        "timer_bars": True,
+    },
+    {
+        "name": "no text antialiasing",
+        "particle_scale": 0.5,
+        "screen_shake": True,
+        "text_antialias": False,
+        "timer_bars": True,
+    },
+    {
+        "name": "no particles",
+        "particle_scale": 0.0,
+        "screen_shake": False,
+        "text_antialias": False,
+        "timer_bars": True,
+    },
+    {
+        "name": "minimal",
+        "particle_scale": 0.0,
+        "screen_shake": False,
+        "text_antialias": False,
+        "timer_bars": False,
+    },
+]
@@ -0,0 +1,403 @@
+"""Pooled hit effects: splat particles, score pop-ups and screen shake."""
+
+import random
+import time
+
+import numpy as np
+import pygame
+
+from . import const
+from .startup import startup_timer
+
+
+class EffectPool:
+    """Fixed-capacity pool of moving, fading sprites.
+
+    Positions, velocities and lifetimes live in preallocated NumPy arrays and
+    are updated for the whole pool at once. Emitting only claims free slots;
+    when none are left the request is truncated instead of evicting live
+    effects.
+    """
+
+    def __init__(self, capacity, gravity=0.0):
+        self.capacity = capacity
+        self.gravity = gravity
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Fade frames (fresh to faded) per slot
+        self.frames = [None] * capacity
+
+        # Scratch buffers reused every update
+        self._step = np.zeros((capacity, 2), dtype=np.float32)
+        self._fade = np.zeros(capacity, dtype=np.float32)
+        self._free = np.zeros(capacity, dtype=bool)
+
+        self.dropped = 0
+
+    def get_live_count(self):
+        """Get number of live effects."""
+        return int(np.count_nonzero(self.alive))
+
+    def get_free_count(self):
+        """Get number of free slots."""
+        return self.capacity - self.get_live_count()
+
+    def emit(self, frames, positions, velocities, lifetime):
+        """Claim one slot per position; returns how many were emitted."""
+        requested = len(positions)
+        np.logical_not(self.alive, out=self._free)
+        slots = np.flatnonzero(self._free)[:requested]
+        emitted = len(slots)
+        self.dropped += requested - emitted
+        if emitted == 0:
+            return 0
+
+        self.pos[slots] = positions[:emitted]
+        self.vel[slots] = velocities[:emitted]
+        self.life[slots] = lifetime
+        self.max_life[slots] = lifetime
+        self.alive[slots] = True
+        for slot in slots.tolist():
+            self.frames[slot] = frames
+        return emitted
+
+    def update(self, dt):
+        """Advance every live effect by dt milliseconds; free slots are skipped."""
+        if not self.alive.any():
+            return
+
+        alive = self.alive
+        if self.gravity:
+            fall = self.vel[:, 1]
+            np.add(fall, self.gravity * dt, out=fall, where=alive)
+        np.multiply(self.vel, dt, out=self._step)
+        np.add(self.pos, self._step, out=self.pos, where=alive[:, None])
+        np.subtract(self.life, dt, out=self.life, where=alive)
+        np.greater(self.life, 0.0, out=self.alive)
+
+    def queue(self, render_list, layer, offset=(0, 0)):
+        """Queue every live effect on the given render list layer.
+
+        Positions are shifted by -offset (the camera position).
+        """
+        slots = np.flatnonzero(self.alive)
+        if len(slots) == 0:
+            return
+
+        np.divide(self.life, self.max_life, out=self._fade)
+        fades = self._fade[slots].tolist()
+        coords = (self.pos[slots] - offset).astype(np.int32).tolist()
+
+        for slot, fade, dest in zip(slots.tolist(), fades, coords):
+            frames = self.frames[slot]
+            step = min(len(frames) - 1, int((1.0 - fade) * len(frames)))
+            render_list.add(layer, frames[step], dest)
+
+    def reset(self):
+        """Kill all effects."""
+        self.alive[:] = False
+        self.dropped = 0
+
+
+class ScreenShake:
+    """Decaying random screen offset, drawn from the given NumPy generator."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.magnitude = 0
+        self.duration = 0
+        self.time_left = 0
+
+    def start(self, magnitude, duration):
+        """Start shaking, keeping the stronger of the current and new shake."""
+        if self.time_left > 0 and magnitude < self.magnitude:
+            return
+        self.magnitude = magnitude
+        self.duration = duration
+        self.time_left = duration
+
+    def update(self, dt):
+        """Advance shake timer by dt milliseconds."""
+        self.time_left = max(0, self.time_left - dt)
+
+    def get_offset(self):
+        """Get current (dx, dy) screen offset."""
+        if self.time_left <= 0:
+            return (0, 0)
+        strength = round(self.magnitude * self.time_left / self.duration)
+        return (
+            int(self.rng.integers(-strength, strength + 1)),
+            int(self.rng.integers(-strength, strength + 1)),
+        )
+
+    def reset(self):
+        """Stop shaking."""
+        self.time_left = 0
+
+
+class EffectSprites:
+    """Splat and score pop-up sprites, shared by every HitEffects using them.
+
+    Nothing is rendered on construction, so creating a game loads no fonts.
+    load() renders the splats and the pop-ups for every point value up to
+    POPUP_PRERENDER_MAX_POINTS in one go; games call it right after their
+    first frame, and it otherwise runs on first use. Pop-ups for longer
+    combos are rendered once, when first needed. Pop-up text uses the small
+    font of the given FontManager.
+    """
+
+    POPUP_COLOR = (255, 220, 80)
+
+    def __init__(self, fonts):
+        self.fonts = fonts
+        self.splat_frames = None
+        self.popup_frames = {}
+
+    def load(self):
+        """Render all splat and common pop-up frames (first call only)."""
+        if self.splat_frames is not None:
+            return
+
+        with startup_timer.phase("effect sprites"):
+            self.splat_frames = [
+                self._build_fade_frames(self._create_splat(color))
+                for color in (const.ZOMBIE_COLOR, const.HIT_COLOR)
+            ]
+            for points in range(
+                const.POINTS_PER_HIT, const.POPUP_PRERENDER_MAX_POINTS + 1
+            ):
+                self._render_popup(points)
+
+    def get_splat_frames(self):
+        """Get fade frames of both splat colors."""
+        self.load()
+        return self.splat_frames
+
+    def get_popup_frames(self, points):
+        """Get fade frames for a '+points' pop-up."""
+        self.load()
+        frames = self.popup_frames.get(points)
+        if frames is None:
+            frames = self._render_popup(points)
+        return frames
+
+    def _render_popup(self, points):
+        """Render and cache fade frames for a '+points' pop-up."""
+        text = self.fonts.small.render(f"+{points}", True, self.POPUP_COLOR)
+        frames = self._build_fade_frames(text)
+        self.popup_frames[points] = frames
+        return frames
+
+    @staticmethod
+    def _create_splat(color):
+        """Create a single splat particle sprite."""
+        splat = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(splat, color, (4, 4), 4)
+        return splat.convert_alpha()
+
+    @staticmethod
+    def _build_fade_frames(surface):
+        """Build copies of surface at decreasing opacity."""
+        frames = []
+        for step in range(const.PARTICLE_FADE_STEPS):
+            frame = surface.copy()
+            frame.set_alpha(255 - step * 255 // const.PARTICLE_FADE_STEPS)
+            frames.append(frame)
+        return tuple(frames)
+
+
+class HitEffects:
+    """Spawns and draws the effects triggered by zombie hits.
+
+    Sprites come from a (possibly shared) EffectSprites, and bursts are
+    drawn into preallocated scratch arrays, so gameplay only claims pool
+    slots.
+    """
+
+    def __init__(self, sprites):
+        self.sprites = sprites
+
+        # Seeded from the global RNG so seeding `random` makes effects repeatable
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        self.particles = EffectPool(
+            const.PARTICLE_POOL_SIZE, gravity=const.PARTICLE_GRAVITY
+        )
+        self.popups = EffectPool(const.POPUP_POOL_SIZE)
+        self.shake = ScreenShake(self.rng)
+
+        # Scratch arrays for spawning, sized for the largest burst
+        self._spray_angles = np.zeros(const.MAX_PARTICLES_PER_HIT)
+        self._spray_speeds = np.zeros(const.MAX_PARTICLES_PER_HIT)
+        self._spray_velocities = np.zeros((const.MAX_PARTICLES_PER_HIT, 2))
+        self._spray_positions = np.zeros(
+            (const.MAX_PARTICLES_PER_HIT, 2), dtype=np.float32
+        )
+        self._popup_position = np.zeros((1, 2), dtype=np.float32)
+        self._popup_velocity = np.array(
+            [(0.0, -const.POPUP_RISE_SPEED)], dtype=np.float32
+        )
+
+        # Quality settings (see QualityGovernor)
+        self.particle_scale = 1.0
+        self.shake_enabled = True
+
+    def spawn_hit(self, x, y, points, combo):
+        """Spawn splat, score pop-up and (on combos) shake for a hit at a hole."""
+        self._spawn_splat(x - 10, y - 10, combo)
+
+        popup = self.sprites.get_popup_frames(points)
+        width = popup[0].get_width()
+        self._popup_position[0] = (x - 10 - width // 2, y - 60)
+        self.popups.emit(
+            popup, self._popup_position, self._popup_velocity, const.POPUP_LIFETIME
+        )
+
+        if self.shake_enabled and combo >= const.COMBO_DISPLAY_THRESHOLD:
+            magnitude = min(const.SHAKE_MAX_MAGNITUDE, 2 + combo // 3)
+            self.shake.start(magnitude, const.SHAKE_DURATION)
+
+    def update(self, dt):
+        """Advance all effects by dt milliseconds."""
+        self.particles.update(dt)
+        self.popups.update(dt)
+        self.shake.update(dt)
+
+    def queue(self, render_list, layer, offset=(0, 0)):
+        """Queue particles, then pop-ups, on the given render list layer."""
+        self.particles.queue(render_list, layer, offset)
+        self.popups.queue(render_list, layer, offset)
+
+    def get_shake_offset(self):
+        """Get current screen shake offset."""
+        return self.shake.get_offset()
+
+    def reset(self):
+        """Clear all effects."""
+        self.particles.reset()
+        self.popups.reset()
+        self.shake.reset()
+
+    def _spawn_splat(self, x, y, combo):
+        """Emit a burst of splat particles, shrinking it when the pool is low.
+
+        Bursts scale down linearly once less than a quarter of the pool is
+        free, so effects thin out instead of stopping abruptly mid-combo.
+        """
+        count = min(
+            const.MAX_PARTICLES_PER_HIT,
+            const.PARTICLES_PER_HIT + combo * const.PARTICLES_PER_COMBO,
+        )
+        count = int(count * self.particle_scale)
+        if count <= 0:
+            return
+
+        reserve = self.particles.capacity // 4
+        free = self.particles.get_free_count()
+        if free < reserve:
+            count = count * free // reserve
+        if count <= 0:
+            self.particles.dropped += 1
+            return
+
+        # Upward-biased spray, drawn into the scratch arrays
+        angles = self._spray_angles[:count]
+        self.rng.random(out=angles)
+        np.multiply(angles, np.pi, out=angles)
+        np.subtract(angles, np.pi, out=angles)
+
+        speeds = self._spray_speeds[:count]
+        self.rng.random(out=speeds)
+        speed_range = const.PARTICLE_MAX_SPEED - const.PARTICLE_MIN_SPEED
+        np.multiply(speeds, speed_range, out=speeds)
+        np.add(speeds, const.PARTICLE_MIN_SPEED, out=speeds)
+
+        velocities = self._spray_velocities[:count]
+        np.cos(angles, out=velocities[:, 0])
+        np.sin(angles, out=velocities[:, 1])
+        np.multiply(velocities, speeds[:, None], out=velocities)
+
+        positions = self._spray_positions[:count]
+        positions[:] = (x, y)
+
+        # Emit each color variant as its own slice of the burst
+        splat_frames = self.sprites.get_splat_frames()
+        half = count // 2
+        self.particles.emit(
+            splat_frames[0],
+            positions[:half],
+            velocities[:half],
+            const.PARTICLE_LIFETIME,
+        )
+        self.particles.emit(
+            splat_frames[1],
+            positions[half:],
+            velocities[half:],
+            const.PARTICLE_LIFETIME,
+        )
+
+
+def benchmark(num_particles=1500, frames=600):
+    """Measure per-frame cost of updating and drawing num_particles particles.
+
+    Runs headless; particles are respawned as they expire so the pool stays
+    at the requested load for the whole run.
+    """
+    from .font import FontManager
+    from .render import RenderList
+
+    num_particles = min(num_particles, const.PARTICLE_POOL_SIZE)
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((const.WIDTH, const.HEIGHT))
+
+    effects = HitEffects(EffectSprites(FontManager()))
+    render_list = RenderList(["effects"])
+    dt = 1000 / 60
+    update_time = 0.0
+    draw_time = 0.0
+
+    live_total = 0
+
+    for _ in range(frames):
+        live = effects.particles.get_live_count()
+        while live < num_particles:
+            x = random.randrange(const.WIDTH)
+            y = random.randrange(const.HEIGHT)
+            effects.spawn_hit(x, y, 10, 0)
+
+            # Near capacity the pool reserve shrinks bursts to nothing
+            spawned = effects.particles.get_live_count()
+            if spawned == live:
+                break
+            live = spawned
+        live_total += live
+
+        start = time.perf_counter()
+        effects.update(dt)
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        effects.queue(render_list, "effects")
+        render_list.flush(screen)
+        draw_time += time.perf_counter() - start
+
+    pygame.quit()
+    print(
+        f"Particles: {num_particles} requested, {live_total / frames:.0f} live"
+        f" | Frames: {frames}"
+    )
+    print(f"Update: {update_time / frames * 1000:.3f} ms/frame")
+    print(f"Draw:   {draw_time / frames * 1000:.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    import os
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    benchmark()
@@ -0,0 +1,40 @@
+"""Font management."""
+
+import pygame
+
+from .startup import startup_timer
+
+
+class FontManager:
+    """Loads game fonts on first use."""
+
+    LARGE_PATH = "assets/pixel_square/Pixel Square Bold10.ttf"
+    LARGE_SIZE = 64
+    SMALL_PATH = "assets/pixel_square/Pixel Square 10.ttf"
+    SMALL_SIZE = 36
+
+    def __init__(self):
+        self._large = None
+        self._small = None
+
+    @property
+    def large(self):
+        """Large (title/score) font."""
+        if self._large is None:
+            self.load()
+        return self._large
+
+    @property
+    def small(self):
+        """Small (body text) font."""
+        if self._small is None:
+            self.load()
+        return self._small
+
+    def load(self):
+        """Initialize the font module and load all fonts."""
+        with startup_timer.phase("font load"):
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._large = pygame.font.Font(self.LARGE_PATH, self.LARGE_SIZE)
+            self._small = pygame.font.Font(self.SMALL_PATH, self.SMALL_SIZE)
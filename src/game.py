@@ -1,10 +1,19 @@
 """Main game logic and state management."""
 
 import random
+import threading
 
 import pygame
 
 from . import const
+from .analytics import ReactionStats, record_session
+from .board import Board
+from .camera import Camera
+from .effects import EffectSprites, HitEffects
+from .font import FontManager
+from .quality import QualityGovernor
+from .render import RenderList
+from .startup import startup_timer
 from .zombie import ZombieManager
 
 
@@ -24,6 +33,8 @@ class GameState:
         self.is_game_over = False
         self.hit_count = 0
         self.miss_count = 0
+        self.reactions = ReactionStats()
+        self.reactions_recorded = False
 
     def add_score(self, points):
         """Add points to score and check for level up."""
@@ -56,6 +67,10 @@ class GameState:
         """Increment hit counter"""
         self.hit_count += 1
 
+    def record_reaction(self, reaction_time, hole_index):
+        """Record how long a zombie was up before being hit (ms)."""
+        self.reactions.add(reaction_time, self.level, hole_index)
+
     def register_miss(self):
         """Increment miss counter"""
         self.miss_count += 1
@@ -112,56 +127,155 @@ class Game:
     STATE_PAUSE = "PAUSE"
     STATE_GAMEOVER = "GAMEOVER"
 
-    def __init__(self, screen, textures, soundtracks):
+    # Keys that scroll the camera while held
+    SCROLL_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+    # Event types the game reacts to; everything else is dropped by SDL
+    # before reaching the queue, keeping polling cheap under heavy touch input
+    ALLOWED_EVENTS = [
+        pygame.QUIT,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.FINGERDOWN,
+    ]
+
+    def __init__(
+        self,
+        screen,
+        textures,
+        soundtracks,
+        recorder=None,
+        board=None,
+        stats_path=None,
+        fonts=None,
+        effect_sprites=None,
+    ):
         self.screen = screen
         self.textures = textures
         self.soundtracks = soundtracks
 
+        # Cumulative reaction stats file, updated at game over (optional)
+        self.stats_path = stats_path
+        self.stats_writers = []
+
+        # Board and camera (the classic board fits the screen exactly)
+        self.board = board or Board.classic()
+        self.camera = Camera(screen.get_size(), (self.board.width, self.board.height))
+        self.camera.center_on((self.board.width // 2, self.board.height // 2))
+
+        # Frame capture (optional FrameRecorder)
+        self.recorder = recorder
+
         # Timing
         self.clock = pygame.time.Clock()
+        self.frame_time = 0
         self.last_spawn_attempt = 0
         self.total_pause_time = 0
         self.pause_start_time = 0
 
-        # Fonts
-        self.font_large = pygame.font.Font(
-            "assets/pixel_square/Pixel Square Bold10.ttf", 64
-        )
-        self.font_small = pygame.font.Font(
-            "assets/pixel_square/Pixel Square 10.ttf", 36
-        )
+        # Fonts (loaded on first render; may be shared between games)
+        self.fonts = fonts or FontManager()
 
         # Game state
         self.state = self.STATE_MENU
         self.game_state = GameState()
-        self.zombie_manager = ZombieManager(len(const.GRID_POSITIONS))
+        self.zombie_manager = ZombieManager(len(self.board))
 
         # Debug
         self.show_hitboxes = False
 
+        # Camera scroll keys held down, tracked from this game's own events
+        self.held_keys = set()
+
         # Cache sprite dimensions
         self.zombie_width = self.textures.zombie_sprite.get_width()
         self.zombie_height = self.textures.zombie_sprite.get_height()
         self.zombie_half_width = self.zombie_width // 2
 
+        # Draw calls are queued per layer and submitted in batches
+        self.render_list = RenderList(["ground", "sprites", "bars", "effects", "hud"])
+
+        # Hit effects (particles, pop-ups, screen shake); sprites may be shared
+        self.effects = HitEffects(effect_sprites or EffectSprites(self.fonts))
+        self.shake_offset = (0, 0)
+
+        # Adaptive quality
+        self.quality = QualityGovernor()
+        self.text_antialias = True
+        self.show_timer_bars = True
+        self.apply_quality(self.quality.get_settings())
+
+        # Dimming overlay for menus (created on first use)
+        self.overlay = None
+
+        # Input
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.ALLOWED_EVENTS)
+
     def run(self):
         """Main game loop."""
         self.running = True
-        self.soundtracks.play_music()
+        self.start()
 
         while self.running:
-            self.clock.tick(60)
+            self.frame_time = self.clock.tick(60)
+
+            # Work time of the last frame, excluding the frame cap's wait
+            if self.quality.add_frame(self.clock.get_rawtime()):
+                self.apply_quality(self.quality.get_settings())
 
             self._handle_events()
             self._update()
             self._render()
 
+        self.finish()
         pygame.quit()
 
+    def finish(self):
+        """Record the session's reaction stats and release capture resources.
+
+        Called when the game loop ends, so sessions quit mid-game are kept.
+        Waits for pending stats writes.
+        """
+        self._record_reactions()
+        for writer in self.stats_writers:
+            writer.join()
+        self.stats_writers.clear()
+        if self.recorder:
+            self.recorder.close()
+
+    def start(self):
+        """Present the first frame, then load audio and effect sprites."""
+        self._render()
+        startup_timer.mark_first_frame()
+        self.soundtracks.play_music()
+        self.effects.sprites.load()
+
+    def step(self, frame_time, events):
+        """Advance and draw one frame without presenting it.
+
+        Used by a scheduler driving several games, which polls events, flips
+        the display and adapts quality (through apply_quality) once for all
+        of them.
+        """
+        self.frame_time = frame_time
+        self._process_events(events)
+        self._update()
+        self.draw()
+
+    def apply_quality(self, settings):
+        """Apply a quality level's settings."""
+        self.text_antialias = settings["text_antialias"]
+        self.show_timer_bars = settings["timer_bars"]
+        self.effects.particle_scale = settings["particle_scale"]
+        self.effects.shake_enabled = settings["screen_shake"]
+
     def reset_game(self):
         """Reset game for new playthrough."""
         self.game_state.reset()
         self.zombie_manager.reset()
+        self.effects.reset()
         self.state = self.STATE_PLAY
         self.total_pause_time = 0
         self.last_spawn_attempt = self._get_game_time()
@@ -169,14 +283,36 @@ class Game:
     # ==================== EVENT HANDLING ====================
 
     def _handle_events(self):
-        """Process all input events."""
-        for event in pygame.event.get():
+        """Process all pending input events."""
+        self._process_events(pygame.event.get())
+
+    def _process_events(self, events):
+        """Process input events.
+
+        Mouse clicks and touch contacts are collected for the whole frame and
+        resolved together, so simultaneous contacts are scored consistently.
+        """
+        contacts = []
+
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
+                if event.key in self.SCROLL_KEYS:
+                    self.held_keys.add(event.key)
                 self._handle_keypress(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held_keys.discard(event.key)
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._handle_click(event)
+                # Only left click; SDL also emits clicks synthesized from touch,
+                # which would duplicate the matching FINGERDOWN contact
+                if event.button == 1 and not getattr(event, "touch", False):
+                    contacts.append(event.pos)
+            elif event.type == pygame.FINGERDOWN:
+                contacts.append(self._finger_to_screen(event))
+
+        if contacts:
+            self._handle_contacts(contacts)
 
     def _handle_keypress(self, key):
         """Handle keyboard input."""
@@ -186,6 +322,8 @@ class Game:
             self._restart_game()
         elif key == pygame.K_h:
             self._toggle_hitboxes()
+        elif key == pygame.K_F12 and self.recorder:
+            self.recorder.dump()
         elif key == pygame.K_q:
             self.running = False
 
@@ -195,60 +333,85 @@ class Game:
             self.reset_game()
         elif self.state == self.STATE_PLAY:
             self.state = self.STATE_PAUSE
-            self.pause_start_time = pygame.time.get_ticks()
+            self.pause_start_time = self._get_ticks()
         elif self.state == self.STATE_PAUSE:
             self.state = self.STATE_PLAY
-            pause_duration = pygame.time.get_ticks() - self.pause_start_time
+            pause_duration = self._get_ticks() - self.pause_start_time
             self.total_pause_time += pause_duration
 
+    def _get_ticks(self):
+        """Get wall-clock milliseconds (overridden to script time in replays)."""
+        return pygame.time.get_ticks()
+
     def _get_game_time(self):
-        return pygame.time.get_ticks() - self.total_pause_time
+        return self._get_ticks() - self.total_pause_time
 
     def _restart_game(self):
         """Restart game after game over."""
         self.reset_game()
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.play(-1)
+        self.soundtracks.restart_music()
 
     def _toggle_hitboxes(self):
         """Toggle hitbox visualization."""
         self.show_hitboxes = not self.show_hitboxes
         print(f"Hitboxes: {'ON' if self.show_hitboxes else 'OFF'}")
 
-    def _handle_click(self, event):
-        """Handle mouse click events."""
-        if event.button != 1:  # Only left click
-            return
-
+    def _finger_to_screen(self, event):
+        """Map a normalized (0..1) touch position to screen coordinates."""
+        width, height = self.screen.get_size()
+        x = min(width - 1, int(event.x * width))
+        y = min(height - 1, int(event.y * height))
+        return (x, y)
+
+    def _handle_contacts(self, contacts):
+        """Resolve all contacts polled this frame in one batched pass.
+
+        Hits are scored in contact order so combo bonuses keep stacking, then
+        any misses break the combo once. Extra contacts landing on a zombie
+        already hit in this same batch (e.g. several fingers of one slap) are
+        ignored rather than counted as misses.
+        """
         if self.state != self.STATE_PLAY or self.game_state.is_game_over:
             return
 
-        mouse_pos = event.pos
-        hit_registered = False
+        holes, hitboxes = self._get_live_hitboxes()
+        struck_hitboxes = []
+        misses = 0
 
-        # Check if click hit any zombie
-        for i, grid_pos in enumerate(const.GRID_POSITIONS):
-            if not self.zombie_manager.is_hole_occupied(i):
-                continue
-
-            zombie = self.zombie_manager.get_zombie(i)
-            if zombie.is_hit:
-                continue
-
-            hitbox = self._get_hitbox(grid_pos)
-            if hitbox.collidepoint(mouse_pos):
-                self._register_hit(i)
-                hit_registered = True
-                break
+        for pos in contacts:
+            point = pygame.Rect(self.camera.screen_to_world(pos), (1, 1))
+            index = point.collidelist(hitboxes)
+            if index != -1:
+                self._register_hit(holes.pop(index))
+                struck_hitboxes.append(hitboxes.pop(index))
+            elif point.collidelist(struck_hitboxes) == -1:
+                misses += 1
 
         # Miss penalty
-        if not hit_registered and self.game_state.combo > 0:
+        if misses and self.game_state.combo > 0:
             self.game_state.break_combo()
-            self.game_state.register_miss()
+            for _ in range(misses):
+                self.game_state.register_miss()
             self.soundtracks.play_miss()
 
+    def _get_live_hitboxes(self):
+        """Get parallel lists of hole indices and world hitboxes of unhit zombies."""
+        holes = []
+        hitboxes = []
+        for i in self._get_visible_holes():
+            zombie = self.zombie_manager.get_zombie(i)
+            if zombie is None or zombie.is_hit:
+                continue
+            holes.append(i)
+            hitboxes.append(self._get_hitbox(self.board.positions[i]))
+        return holes, hitboxes
+
     def _register_hit(self, hole_index):
         """Register successful zombie hit."""
+        zombie = self.zombie_manager.get_zombie(hole_index)
+        reaction_time = self._get_game_time() - zombie.spawn_time
+        self.game_state.record_reaction(reaction_time, hole_index)
+
         self.zombie_manager.hit_zombie(hole_index)
 
         # Score with combo bonus
@@ -257,6 +420,9 @@ class Game:
         self.game_state.increment_combo()
         self.game_state.register_hit()
 
+        x, y = self.board.positions[hole_index]
+        self.effects.spawn_hit(x, y, points, self.game_state.combo)
+
         self.soundtracks.play_hit()
 
     # ==================== UPDATE ====================
@@ -266,6 +432,9 @@ class Game:
         if self.state != self.STATE_PLAY or self.game_state.is_game_over:
             return
 
+        self.effects.update(self.frame_time)
+        self._update_camera()
+
         difficulty = DifficultyManager.get_difficulty(self.game_state.level)
 
         # Attempt to spawn zombies
@@ -285,6 +454,42 @@ class Game:
 
             if self.game_state.is_game_over:
                 self.state = self.STATE_GAMEOVER
+                if self.recorder:
+                    self.recorder.dump()
+                self._record_reactions()
+
+    def _record_reactions(self):
+        """Merge this game's reaction stats into the stats file (once).
+
+        The file is locked and rewritten on a background thread, so the frame
+        never waits for other processes sharing the file. The thread gets a
+        snapshot, since the game over screen keeps querying the live stats.
+        """
+        game_state = self.game_state
+        if (
+            not self.stats_path
+            or game_state.reactions_recorded
+            or game_state.reactions.overall.stats.count == 0
+        ):
+            return
+
+        snapshot = ReactionStats.from_dict(game_state.reactions.to_dict())
+        writer = threading.Thread(
+            target=record_session, args=(self.stats_path, snapshot)
+        )
+        writer.start()
+        self.stats_writers = [w for w in self.stats_writers if w.is_alive()]
+        self.stats_writers.append(writer)
+        game_state.reactions_recorded = True
+
+    def _update_camera(self):
+        """Scroll the camera with the arrow keys held down."""
+        keys = self.held_keys
+        dx = (pygame.K_RIGHT in keys) - (pygame.K_LEFT in keys)
+        dy = (pygame.K_DOWN in keys) - (pygame.K_UP in keys)
+        if dx or dy:
+            step = const.CAMERA_SPEED * self.frame_time
+            self.camera.move(round(dx * step), round(dy * step))
 
     def _attempt_spawn(self, current_time, difficulty):
         """Try to spawn a new zombie."""
@@ -299,8 +504,10 @@ class Game:
         if random.random() >= difficulty["spawn_chance"]:
             return
 
-        # Pick random available hole
-        available_holes = self.zombie_manager.get_available_holes()
+        # Pick random available hole on screen
+        available_holes = self.zombie_manager.get_available_holes(
+            self._get_spawnable_holes()
+        )
         if not available_holes:
             return
 
@@ -310,44 +517,90 @@ class Game:
     # ==================== RENDERING ====================
 
     def _render(self):
-        """Render current frame."""
+        """Render and present current frame."""
+        self.draw()
+
+        pygame.display.flip()
+
+        if self.recorder:
+            self.recorder.capture(self.screen)
+
+    def draw(self):
+        """Draw current frame to the screen surface without presenting it."""
+        # Screen shake offsets the playfield, not the HUD
+        if self.state == self.STATE_PLAY:
+            self.shake_offset = self.effects.get_shake_offset()
+        else:
+            self.shake_offset = (0, 0)
+
         # Background
-        self.screen.blit(self.textures.background, (0, 0))
+        self._render_board()
 
         if self.state == self.STATE_PLAY:
             current_time = self._get_game_time()
             self._render_gameplay(current_time)
 
         self._render_overlay()
-
-        pygame.display.flip()
+        self.render_list.flush(self.screen)
 
     def _render_gameplay(self, current_time):
         """Render active gameplay elements."""
         difficulty = DifficultyManager.get_difficulty(self.game_state.level)
 
-        # Draw zombies
-        for i, grid_pos in enumerate(const.GRID_POSITIONS):
+        # Draw zombies (only holes near the viewport)
+        for i in self._get_visible_holes():
             zombie = self.zombie_manager.get_zombie(i)
             if zombie:
+                screen_pos = self._to_screen(self.board.positions[i])
                 self._render_zombie(
-                    zombie, grid_pos, current_time, difficulty["show_duration"]
+                    zombie, screen_pos, current_time, difficulty["show_duration"]
                 )
 
-        # Draw hitboxes (debug)
+        # Draw hit effects
+        self.effects.queue(self.render_list, "effects", self._get_view_offset())
+
+        # Draw hitboxes (debug), drawn directly over the zombies
         if self.show_hitboxes:
+            self.render_list.flush(self.screen)
             self._render_hitboxes()
 
         # Draw UI
         self._render_ui()
 
-    def _render_zombie(self, zombie, grid_pos, current_time, show_duration):
-        """Render a single zombie."""
-        x, y = grid_pos
+    def _render_board(self):
+        """Render the ground and the holes near the viewport."""
+        if self.board.has_backdrop:
+            if self.shake_offset != (0, 0):
+                # Fill the edge the shifted backdrop uncovers
+                self.screen.fill(const.BG_COLOR)
+            self.screen.blit(self.textures.background, self.shake_offset)
+            return
+
+        # Tile the ground, scrolled with the camera
+        tile = self.textures.ground_tile
+        tile_width, tile_height = tile.get_size()
+        camera_x, camera_y = self._get_view_offset()
+        width, height = self.screen.get_size()
+        for y in range(-(camera_y % tile_height), height, tile_height):
+            for x in range(-(camera_x % tile_width), width, tile_width):
+                self.render_list.add("ground", tile, (x, y))
+
+        hole = self.textures.hole_sprite
+        half_width = hole.get_width() // 2
+        half_height = hole.get_height() // 2
+        for i in self._get_visible_holes():
+            x, y = self._to_screen(self.board.positions[i])
+            self.render_list.add("ground", hole, (x - half_width, y - half_height))
+
+    def _render_zombie(self, zombie, screen_pos, current_time, show_duration):
+        """Queue a single zombie for rendering."""
+        x, y = screen_pos
 
         # Squashed zombie (hit)
         if zombie.is_hit:
-            self.screen.blit(self.textures.zombie_sprite_squashed, (x - 50, y - 20))
+            self.render_list.add(
+                "sprites", self.textures.zombie_sprite_squashed, (x - 50, y - 20)
+            )
             return
 
         # Rising zombie
@@ -356,48 +609,52 @@ class Game:
             return
 
         # Crop sprite from top (head appears first)
-        crop_rect = pygame.Rect(0, 0, self.zombie_width, visible_height)
-        cropped_sprite = self.textures.zombie_sprite.subsurface(crop_rect)
-        self.screen.blit(cropped_sprite, (x - 50, y - visible_height))
+        crop_rect = (0, 0, self.zombie_width, visible_height)
+        self.render_list.add(
+            "sprites",
+            self.textures.zombie_sprite,
+            (x - 50, y - visible_height),
+            crop_rect,
+        )
 
         # Timer bar (only when mostly visible)
-        if zombie.is_fully_risen(current_time, self.zombie_height):
+        if self.show_timer_bars and zombie.is_fully_risen(
+            current_time, self.zombie_height
+        ):
             time_ratio = zombie.get_time_remaining_ratio(current_time, show_duration)
             self._render_timer_bar(x, y - visible_height, time_ratio)
 
     def _render_timer_bar(self, x, y, time_ratio):
-        """Render countdown timer above zombie head."""
-        bar_width = 60
-        bar_height = 6
-        bar_x = x - bar_width // 2 - 10
-        bar_y = y - 15
+        """Queue countdown timer above zombie head."""
+        bar_width = const.TIMER_BAR_WIDTH
+        bar_pos = (x - bar_width // 2 - 10, y - 15)
 
-        # Background
-        pygame.draw.rect(
-            self.screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height)
-        )
+        # Background with border
+        self.render_list.add("bars", self.textures.timer_bar_empty, bar_pos)
 
         # Colored fill (changes based on time remaining)
         fill_width = int(bar_width * time_ratio)
         if time_ratio > 0.5:
-            color = (100, 255, 100)  # Green
+            color = const.TIMER_BAR_GREEN
         elif time_ratio > 0.25:
-            color = (255, 200, 50)  # Yellow
+            color = const.TIMER_BAR_YELLOW
         else:
-            color = (255, 70, 70)  # Red
+            color = const.TIMER_BAR_RED
 
         if fill_width > 0:
-            pygame.draw.rect(self.screen, color, (bar_x, bar_y, fill_width, bar_height))
-
-        # Border
-        pygame.draw.rect(
-            self.screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 1
-        )
+            self.render_list.add(
+                "bars",
+                self.textures.timer_bar_fills[color],
+                bar_pos,
+                (0, 0, fill_width, const.TIMER_BAR_HEIGHT),
+            )
 
     def _render_hitboxes(self):
         """Render hitbox visualization (debug)."""
-        for grid_pos in const.GRID_POSITIONS:
-            hitbox = self._get_hitbox(grid_pos)
+        view_x, view_y = self._get_view_offset()
+        for i in self._get_visible_holes():
+            hitbox = self._get_hitbox(self.board.positions[i])
+            hitbox.move_ip(-view_x, -view_y)
             pygame.draw.rect(self.screen, const.RED, hitbox, 3)
             pygame.draw.circle(self.screen, const.WHITE, hitbox.center, 5)
 
@@ -405,49 +662,51 @@ class Game:
         """Render UI elements (score, lives, combo, level)."""
 
         # Score
-        score_text = self.font_large.render(
-            f"{self.game_state.score}", True, const.WHITE
+        score_text = self.fonts.large.render(
+            f"{self.game_state.score}", self.text_antialias, const.WHITE
         )
         score_x, score_y = 40, 20
-        self.screen.blit(score_text, (score_x, score_y))
+        self.render_list.add("hud", score_text, (score_x, score_y))
 
         # Hit/Miss Stats (to the right of score)
         hit_ratio = self.game_state.get_hit_ratio()
-        stats_text = self.font_small.render(
+        stats_text = self.fonts.small.render(
             f"HITS: {self.game_state.hit_count} | MISS: {self.game_state.miss_count} | ACC: {hit_ratio:.1f}%",
-            True,
+            self.text_antialias,
             (200, 200, 200),
         )
         padding = 20
         stats_x = score_x + max(150, score_text.get_width()) + padding
         stats_y = score_y + (score_text.get_height() - stats_text.get_height()) // 2
-        self.screen.blit(stats_text, (stats_x, stats_y))
+        self.render_list.add("hud", stats_text, (stats_x, stats_y))
 
         # Lives (red if low)
         lives_color = (255, 70, 70) if self.game_state.lives <= 2 else (160, 220, 255)
-        lives_text = self.font_large.render(
-            f"LIVES: {self.game_state.lives}", True, lives_color
+        lives_text = self.fonts.large.render(
+            f"LIVES: {self.game_state.lives}", self.text_antialias, lives_color
         )
-        lives_x = const.WIDTH - lives_text.get_width() - 40
+        width = self.screen.get_width()
+        lives_x = width - lives_text.get_width() - 40
         lives_y = 20
-        self.screen.blit(lives_text, (lives_x, lives_y))
+        self.render_list.add("hud", lives_text, (lives_x, lives_y))
 
         # Level (under lives)
-        level_text = self.font_small.render(
-            f"LEVEL {self.game_state.level}", True, (180, 255, 180)
+        level_text = self.fonts.small.render(
+            f"LEVEL {self.game_state.level}", self.text_antialias, (180, 255, 180)
         )
-        level_x = const.WIDTH - level_text.get_width() - 40
+        level_x = width - level_text.get_width() - 40
         level_y = lives_y + lives_text.get_height() + 8
-        self.screen.blit(level_text, (level_x, level_y))
+        self.render_list.add("hud", level_text, (level_x, level_y))
 
         # Combo (only show if >= threshold)
         if self.game_state.combo >= const.COMBO_DISPLAY_THRESHOLD:
-            combo_text = self.font_small.render(
-                f"COMBO x{self.game_state.combo}", True, (255, 220, 80)
+            combo_text = self.fonts.small.render(
+                f"COMBO x{self.game_state.combo}", self.text_antialias, (255, 220, 80)
             )
-            self.screen.blit(
+            self.render_list.add(
+                "hud",
                 combo_text,
-                (const.WIDTH // 2 - combo_text.get_width() // 2, 80),
+                (width // 2 - combo_text.get_width() // 2, 80),
             )
 
     def _render_overlay(self):
@@ -461,67 +720,124 @@ class Game:
 
     def _render_menu(self):
         """Render main menu."""
-        overlay = self._create_overlay()
-        self.screen.blit(overlay, (0, 0))
+        overlay = self._get_overlay()
+        self.render_list.add("hud", overlay, (0, 0))
+        center_y = self.screen.get_height() // 2
 
-        title_text = self.font_large.render("WHACK-A-ZOMBIE", True, const.WHITE)
-        start_text = self.font_small.render(
-            "Press SPACEBAR to START", True, (160, 240, 160)
+        title_text = self.fonts.large.render(
+            "WHACK-A-ZOMBIE", self.text_antialias, const.WHITE
         )
-        instruct_text = self.font_small.render(
-            "Whack zombies before they escape! (H for hitboxes)", True, (220, 220, 240)
+        start_text = self.fonts.small.render(
+            "Press SPACEBAR to START", self.text_antialias, (160, 240, 160)
+        )
+        instruct_text = self.fonts.small.render(
+            "Whack zombies before they escape! (H for hitboxes)",
+            self.text_antialias,
+            (220, 220, 240),
         )
 
-        self._center_blit(title_text, const.HEIGHT // 2 - 80)
-        self._center_blit(start_text, const.HEIGHT // 2 + 20)
-        self._center_blit(instruct_text, const.HEIGHT // 2 + 80)
+        self._center_blit(title_text, center_y - 80)
+        self._center_blit(start_text, center_y + 20)
+        self._center_blit(instruct_text, center_y + 80)
 
     def _render_pause(self):
         """Render pause screen."""
-        overlay = self._create_overlay()
-        self.screen.blit(overlay, (0, 0))
+        overlay = self._get_overlay()
+        self.render_list.add("hud", overlay, (0, 0))
+        center_y = self.screen.get_height() // 2
 
-        paused_text = self.font_large.render("PAUSED", True, (255, 220, 80))
-        resume_text = self.font_small.render(
-            "SPACE to resume (Q quit)", True, (160, 240, 160)
+        paused_text = self.fonts.large.render(
+            "PAUSED", self.text_antialias, (255, 220, 80)
+        )
+        resume_text = self.fonts.small.render(
+            "SPACE to resume (Q quit)", self.text_antialias, (160, 240, 160)
         )
 
-        self._center_blit(paused_text, const.HEIGHT // 2 - 40)
-        self._center_blit(resume_text, const.HEIGHT // 2 + 40)
+        self._center_blit(paused_text, center_y - 40)
+        self._center_blit(resume_text, center_y + 40)
 
     def _render_gameover(self):
         """Render game over screen."""
-        overlay = self._create_overlay()
-        self.screen.blit(overlay, (0, 0))
+        overlay = self._get_overlay()
+        self.render_list.add("hud", overlay, (0, 0))
+        center_y = self.screen.get_height() // 2
 
-        gameover_text = self.font_large.render("GAME OVER", True, (255, 60, 60))
+        gameover_text = self.fonts.large.render(
+            "GAME OVER", self.text_antialias, (255, 60, 60)
+        )
 
         # Final stats with hit ratio
         hit_ratio = self.game_state.get_hit_ratio()
-        stats_text = self.font_small.render(
+        stats_text = self.fonts.small.render(
             f"Final Score: {self.game_state.score} | Best Combo: {self.game_state.max_combo}",
-            True,
+            self.text_antialias,
             (220, 220, 240),
         )
 
         # Hit accuracy stats
-        accuracy_text = self.font_small.render(
+        accuracy_text = self.fonts.small.render(
             f"Hits: {self.game_state.hit_count} | Misses: {self.game_state.miss_count} | Accuracy: {hit_ratio:.1f}%",
-            True,
+            self.text_antialias,
             (180, 220, 255),
         )
 
-        restart_text = self.font_small.render(
-            "Press R to play again", True, (160, 240, 160)
+        # Reaction time percentiles
+        reaction_text = self.fonts.small.render(
+            self._format_reaction_times(), self.text_antialias, (255, 220, 160)
+        )
+
+        restart_text = self.fonts.small.render(
+            "Press R to play again", self.text_antialias, (160, 240, 160)
         )
 
-        self._center_blit(gameover_text, const.HEIGHT // 2 - 120)
-        self._center_blit(stats_text, const.HEIGHT // 2 - 20)
-        self._center_blit(accuracy_text, const.HEIGHT // 2 + 30)
-        self._center_blit(restart_text, const.HEIGHT // 2 + 100)
+        self._center_blit(gameover_text, center_y - 120)
+        self._center_blit(stats_text, center_y - 20)
+        self._center_blit(accuracy_text, center_y + 30)
+        self._center_blit(reaction_text, center_y + 80)
+        self._center_blit(restart_text, center_y + 150)
+
+    def _format_reaction_times(self):
+        """Format reaction time mean and percentiles for the game over screen."""
+        reactions = self.game_state.reactions
+        if reactions.overall.stats.count == 0:
+            return "Reaction: no hits"
+
+        parts = [f"Reaction avg {reactions.overall.stats.mean:.0f}ms"]
+        for percentile, value in zip(
+            const.ANALYTICS_PERCENTILES, reactions.get_percentiles()
+        ):
+            parts.append(f"p{percentile} {value:.0f}")
+        return " | ".join(parts)
 
     # ==================== HELPERS ====================
 
+    def _get_view_offset(self):
+        """Get the camera offset with this frame's screen shake applied."""
+        camera_x, camera_y = self.camera.get_offset()
+        shake_x, shake_y = self.shake_offset
+        return (camera_x - shake_x, camera_y - shake_y)
+
+    def _to_screen(self, world_pos):
+        """Map a world position to the shaken playfield on screen."""
+        x, y = self.camera.world_to_screen(world_pos)
+        shake_x, shake_y = self.shake_offset
+        return (x + shake_x, y + shake_y)
+
+    def _get_visible_holes(self):
+        """Get holes whose zombie could be drawn inside the viewport."""
+        return self.board.get_holes_in_rect(
+            self.camera.get_view_rect(), const.BOARD_CULL_MARGIN
+        )
+
+    def _get_spawnable_holes(self):
+        """Get holes whose whole hitbox is inside the viewport."""
+        view = self.camera.get_view_rect()
+        return [
+            i
+            for i in self.board.get_holes_in_rect(view)
+            if view.contains(self._get_hitbox(self.board.positions[i]))
+        ]
+
     def _get_hitbox(self, grid_pos):
         """Get hitbox rectangle for a grid position."""
         x, y = grid_pos
@@ -532,13 +848,14 @@ class Game:
             self.zombie_height,
         )
 
-    def _create_overlay(self):
-        """Create semi-transparent overlay surface."""
-        overlay = pygame.Surface((const.WIDTH, const.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        return overlay
+    def _get_overlay(self):
+        """Get the semi-transparent overlay surface (created once)."""
+        if self.overlay is None:
+            self.overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self.overlay.fill((0, 0, 0, 180))
+        return self.overlay
 
     def _center_blit(self, surface, y_pos):
-        """Blit surface centered horizontally at given y position."""
-        x_pos = const.WIDTH // 2 - surface.get_width() // 2
-        self.screen.blit(surface, (x_pos, y_pos))
+        """Queue surface centered horizontally at given y position."""
+        x_pos = self.screen.get_width() // 2 - surface.get_width() // 2
+        self.render_list.add("hud", surface, (x_pos, y_pos))
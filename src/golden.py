@@ -0,0 +1,364 @@
+"""Golden-image render regression harness.
+
+Replays scripted scenarios (seed, timed inputs, fixed frame time) through
+Game with the SDL dummy drivers and compares rendered frames against stored
+golden images, so render optimizations can be shown to be pixel-identical.
+
+    python -m src.golden record [SCENARIO ...]
+    python -m src.golden check [SCENARIO ...]
+
+The check also runs under pytest (tests/test_golden.py). Re-record and
+commit the golden/ images whenever a change alters rendering on purpose.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+import numpy as np
+import pygame
+
+from . import const
+from .game import Game
+from .soundtrack import SoundManager
+from .texture import TextureManager
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GOLDEN_DIR = os.path.join(ROOT_DIR, "golden")  # Golden images, one dir per scenario
+REPORT_DIR = os.path.join(ROOT_DIR, "golden_report")  # Heatmaps of mismatches
+FRAME_MS = 16  # Scripted time step per frame
+REGION_SIZE = 80  # Heatmap region size (px)
+HEATMAP_SHADES = " .:-=+*#%@"  # Text heatmap, least to most different
+
+
+class Scenario:
+    """A deterministic scripted playthrough.
+
+    Inputs are (time_ms, event_type, attributes) tuples posted to the event
+    queue on the first frame at or after their time.
+    """
+
+    def __init__(self, name, seed, frames, inputs=(), capture_every=1):
+        self.name = name
+        self.seed = seed
+        self.frames = frames
+        self.inputs = sorted(inputs, key=lambda entry: entry[0])
+        self.capture_every = capture_every
+        self.last_golden = None  # (frame, pixels) of the last golden loaded
+
+    def get_golden_path(self, frame):
+        """Get path of the golden image for a frame.
+
+        The first frame is stored as is; each later captured frame is stored
+        as its XOR with the previous one, which is mostly zero and compresses
+        to a few percent of a full frame.
+        """
+        suffix = "png" if frame == 0 else "delta.png"
+        return os.path.join(GOLDEN_DIR, self.name, f"{frame:05d}.{suffix}")
+
+    def load_golden(self, frame):
+        """Load a golden frame as a (width, height, 3) array, or None.
+
+        Frames are decoded along the delta chain, so loading them in order
+        (as check does) reads each file once.
+        """
+        if self.last_golden is not None and self.last_golden[0] == frame:
+            return self.last_golden[1].copy()
+
+        path = self.get_golden_path(frame)
+        if not os.path.exists(path):
+            return None
+        pixels = _load_pixels(path)
+
+        if frame > 0:
+            previous = self.load_golden(frame - self.capture_every)
+            if previous is None:
+                return None
+            np.bitwise_xor(pixels, previous, out=pixels)
+
+        self.last_golden = (frame, pixels)
+        return pixels.copy()
+
+
+def _load_pixels(path):
+    return pygame.surfarray.array3d(pygame.image.load(path))
+
+
+def key(time_ms, key_code):
+    """Scripted key press."""
+    return (time_ms, pygame.KEYDOWN, {"key": key_code})
+
+
+def click(time_ms, pos):
+    """Scripted left click."""
+    return (time_ms, pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": pos})
+
+
+def touch(time_ms, pos, finger_id=0):
+    """Scripted touch contact at a screen position."""
+    x, y = pos
+    attributes = {
+        "touch_id": 0,
+        "finger_id": finger_id,
+        "x": x / const.WIDTH,
+        "y": y / const.HEIGHT,
+    }
+    return (time_ms, pygame.FINGERDOWN, attributes)
+
+
+def _hole_target(grid_pos):
+    """Get a point inside the hitbox of a hole."""
+    x, y = grid_pos
+    return (x - 10, y - 60)
+
+
+SCENARIOS = [
+    Scenario("menu", seed=1, frames=2),
+    Scenario(
+        "gameplay",
+        seed=7,
+        frames=600,
+        capture_every=5,
+        inputs=[key(0, pygame.K_SPACE)]
+        + [
+            click(500 + i * 150, _hole_target(pos))
+            for i, pos in enumerate(const.GRID_POSITIONS)
+        ]
+        + [click(4000, (const.WIDTH // 2, 40))],
+    ),
+    Scenario(
+        "multitouch",
+        seed=11,
+        frames=300,
+        capture_every=5,
+        inputs=[key(0, pygame.K_SPACE)]
+        + [
+            touch(t, _hole_target(pos), finger_id=i)
+            for t in (1500, 2500, 3500)
+            for i, pos in enumerate(const.GRID_POSITIONS)
+        ],
+    ),
+    Scenario(
+        "pause",
+        seed=3,
+        frames=240,
+        capture_every=30,
+        inputs=[
+            key(0, pygame.K_SPACE),
+            key(2000, pygame.K_SPACE),
+            key(3000, pygame.K_SPACE),
+        ],
+    ),
+    Scenario(
+        "gameover",
+        seed=5,
+        frames=1500,
+        capture_every=60,
+        inputs=[key(0, pygame.K_SPACE)],
+    ),
+]
+
+
+class ScriptedGame(Game):
+    """Game driven by scripted time instead of the wall clock."""
+
+    def __init__(self, *args, **kwargs):
+        self.script_time = 0
+        super().__init__(*args, **kwargs)
+
+    def _get_ticks(self):
+        return self.script_time
+
+
+def play(scenario, screen, textures):
+    """Replay a scenario, yielding the index of each frame to capture.
+
+    The rendered frame is on screen when the index is yielded.
+    """
+    random.seed(scenario.seed)
+    pygame.event.clear()
+
+    game = ScriptedGame(screen, textures, SoundManager())
+    game.running = True
+    game.frame_time = FRAME_MS
+    next_input = 0
+
+    for frame in range(scenario.frames):
+        game.script_time = frame * FRAME_MS
+
+        while (
+            next_input < len(scenario.inputs)
+            and scenario.inputs[next_input][0] <= game.script_time
+        ):
+            _, event_type, attributes = scenario.inputs[next_input]
+            pygame.event.post(pygame.event.Event(event_type, attributes))
+            next_input += 1
+
+        game._handle_events()
+        game._update()
+        game._render()
+
+        if frame % scenario.capture_every == 0:
+            yield frame
+
+
+def get_region_heatmap(mismatch, region=REGION_SIZE):
+    """Get the fraction of mismatching pixels in each region.
+
+    Args:
+        mismatch: (width, height) boolean array of differing pixels
+
+    Returns:
+        ndarray: (columns, rows) array of fractions in 0..1
+    """
+    width, height = mismatch.shape
+    columns = -(-width // region)
+    rows = -(-height // region)
+
+    padded = np.zeros((columns * region, rows * region), dtype=bool)
+    padded[:width, :height] = mismatch
+    counts = padded.reshape(columns, region, rows, region).sum(axis=(1, 3))
+    return counts / (region * region)
+
+
+def compare_frame(actual, expected, tolerance=0):
+    """Compare two (width, height, 3) pixel arrays.
+
+    Returns:
+        ndarray: Region heatmap, or None if the frames match
+    """
+    if actual.shape == expected.shape and np.array_equal(actual, expected):
+        return None
+    if actual.shape != expected.shape:
+        return np.ones((1, 1))
+
+    diff = np.abs(actual.astype(np.int16) - expected)
+    mismatch = diff.max(axis=2) > tolerance
+    if not mismatch.any():
+        return None
+    return get_region_heatmap(mismatch)
+
+
+def format_heatmap(heatmap):
+    """Format a region heatmap as text, one line per row of regions."""
+    levels = len(HEATMAP_SHADES) - 1
+    shades = np.ceil(heatmap * levels).astype(int)
+    return "\n".join(
+        "".join(HEATMAP_SHADES[shade] for shade in shades[:, row])
+        for row in range(shades.shape[1])
+    )
+
+
+def save_heatmap(path, expected, heatmap):
+    """Save the golden frame, dimmed and tinted red per differing region."""
+    tint = np.repeat(np.repeat(heatmap, REGION_SIZE, axis=0), REGION_SIZE, axis=1)
+    tint = tint[: expected.shape[0], : expected.shape[1]]
+
+    image = expected // 3
+    image[:, :, 0] = np.maximum(image[:, :, 0], (tint > 0) * 96 + tint * 159)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pygame.image.save(pygame.surfarray.make_surface(image), path)
+
+
+def record(scenarios, screen, textures):
+    """Render scenarios and store their frames as golden images."""
+    for scenario in scenarios:
+        directory = os.path.join(GOLDEN_DIR, scenario.name)
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+
+        scenario.last_golden = None
+        count = 0
+        previous = None
+        for frame in play(scenario, screen, textures):
+            path = scenario.get_golden_path(frame)
+            pixels = pygame.surfarray.array3d(screen)
+            if previous is None:
+                pygame.image.save(screen, path)
+            else:
+                delta = pixels ^ previous
+                pygame.image.save(pygame.surfarray.make_surface(delta), path)
+            previous = pixels
+            count += 1
+        print(f"{scenario.name}: recorded {count} frames")
+
+
+def check(scenarios, screen, textures, tolerance=0):
+    """Render scenarios and compare them against golden images.
+
+    Returns:
+        int: Number of mismatching or missing frames
+    """
+    failures = 0
+
+    for scenario in scenarios:
+        checked = 0
+        for frame in play(scenario, screen, textures):
+            expected = scenario.load_golden(frame)
+            if expected is None:
+                golden_path = scenario.get_golden_path(frame)
+                print(f"{scenario.name} frame {frame}: missing {golden_path}")
+                failures += 1
+                continue
+
+            actual = pygame.surfarray.pixels3d(screen)
+            heatmap = compare_frame(actual, expected, tolerance)
+            del actual  # Unlock screen before the next render
+            checked += 1
+
+            if heatmap is None:
+                continue
+
+            failures += 1
+            report_path = os.path.join(
+                REPORT_DIR, scenario.name, f"{frame:05d}.heatmap.png"
+            )
+            save_heatmap(report_path, expected, heatmap)
+            print(f"{scenario.name} frame {frame}: MISMATCH ({report_path})")
+            print(format_heatmap(heatmap))
+
+        print(f"{scenario.name}: checked {checked} frames")
+
+    return failures
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Golden-image render checks")
+    parser.add_argument("mode", choices=["record", "check"])
+    parser.add_argument("scenarios", nargs="*", help="scenario names (default: all)")
+    parser.add_argument(
+        "--tolerance",
+        type=int,
+        default=0,
+        help="allowed per-channel difference before a pixel counts as changed",
+    )
+    args = parser.parse_args()
+
+    by_name = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in args.scenarios if name not in by_name]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    scenarios = [by_name[name] for name in args.scenarios] or SCENARIOS
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((const.WIDTH, const.HEIGHT))
+    textures = TextureManager()
+    textures.load()
+
+    if args.mode == "record":
+        record(scenarios, screen, textures)
+        return 0
+
+    failures = check(scenarios, screen, textures, args.tolerance)
+    print("OK" if failures == 0 else f"FAILED: {failures} frames")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
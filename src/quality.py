@@ -0,0 +1,83 @@
+"""Adaptive render quality driven by frame time."""
+
+from collections import deque
+
+from . import const
+
+
+class QualityGovernor:
+    """Steps render quality down when frames run over budget, and back up
+    when there is headroom.
+
+    Decisions use the average of a rolling window of frame times that is
+    cleared after every change, so each level is judged on its own frames.
+    Stepping up needs a longer run of headroom than stepping down needs
+    overload, and every step up that has to be undone soon after doubles
+    that wait, so the governor settles instead of oscillating.
+    """
+
+    def __init__(self, levels=const.QUALITY_LEVELS, budget_ms=const.FRAME_BUDGET_MS):
+        self.levels = levels
+        self.budget_ms = budget_ms
+        self.level = 0
+
+        self.samples = deque(maxlen=const.QUALITY_WINDOW)
+        self.sample_total = 0.0
+        self.frames_at_level = 0
+        self.upgrade_delay = const.QUALITY_UPGRADE_DELAY
+        self.last_change_was_up = False
+
+    def get_settings(self):
+        """Get settings of the current quality level."""
+        return self.levels[self.level]
+
+    def add_frame(self, frame_ms):
+        """Record one frame's work time.
+
+        Returns:
+            bool: True if the quality level changed
+        """
+        if len(self.samples) == self.samples.maxlen:
+            self.sample_total -= self.samples[0]
+        self.samples.append(frame_ms)
+        self.sample_total += frame_ms
+        self.frames_at_level += 1
+
+        if len(self.samples) < self.samples.maxlen:
+            return False
+
+        average = self.sample_total / len(self.samples)
+        over_budget = average > self.budget_ms * const.QUALITY_DOWN_THRESHOLD
+        has_headroom = average < self.budget_ms * const.QUALITY_UP_THRESHOLD
+
+        if over_budget and self.level < len(self.levels) - 1:
+            # A step up that could not be sustained: wait longer next time
+            if self.last_change_was_up and self.frames_at_level < self.upgrade_delay:
+                self.upgrade_delay = min(
+                    const.QUALITY_MAX_UPGRADE_DELAY, self.upgrade_delay * 2
+                )
+            self._change_level(self.level + 1, average)
+            return True
+
+        if (
+            has_headroom
+            and self.level > 0
+            and self.frames_at_level >= self.upgrade_delay
+        ):
+            self._change_level(self.level - 1, average)
+            return True
+
+        return False
+
+    def _change_level(self, level, average):
+        """Switch level, log it and start measuring afresh."""
+        print(
+            f"Quality: {self.levels[self.level]['name']} -> "
+            f"{self.levels[level]['name']} "
+            f"(avg frame {average:.1f} ms, budget {self.budget_ms:.1f} ms)"
+        )
+        self.last_change_was_up = level < self.level
+        self.level = level
+        self.samples.clear()
+        self.sample_total = 0.0
+        self.frames_at_level = 0
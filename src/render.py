@@ -0,0 +1,26 @@
+"""Batched draw submission."""
+
+
+class RenderList:
+    """Collects blits per layer and submits each layer with one blits call.
+
+    Layers are drawn in the order given at construction; within a layer,
+    blits keep the order they were added in.
+    """
+
+    def __init__(self, layers):
+        self.layers = {name: [] for name in layers}
+
+    def add(self, layer, surface, dest, area=None):
+        """Queue a blit of surface at dest, optionally cropped to area."""
+        if area is None:
+            self.layers[layer].append((surface, dest))
+        else:
+            self.layers[layer].append((surface, dest, area))
+
+    def flush(self, target):
+        """Submit all queued blits to target, layer by layer, and clear them."""
+        for items in self.layers.values():
+            if items:
+                target.blits(items, doreturn=False)
+                items.clear()
@@ -2,36 +2,53 @@
 
 import pygame
 
+from .startup import startup_timer
+
 
 class SoundManager:
-    """Manages game sound effects and background music."""
+    """Manages game sound effects and background music.
+
+    The mixer is only initialized when sounds are loaded, which happens on
+    the first play_music() call unless load() was called earlier.
+    """
 
     def __init__(self):
         self.hit_sound = None
         self.miss_sound = None
         self.sounds_loaded = False
+        self.load_attempted = False
 
     def load(self):
-        """Load all sound assets."""
-        try:
-            # Sound effects
-            self.hit_sound = pygame.mixer.Sound("assets/hit.wav")
-            self.miss_sound = pygame.mixer.Sound("assets/miss.wav")
-            self.miss_sound.set_volume(0.4)
+        """Initialize the mixer and load all sound assets."""
+        self.load_attempted = True
+        with startup_timer.phase("sound load"):
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+
+                # Sound effects
+                self.hit_sound = pygame.mixer.Sound("assets/hit.wav")
+                self.miss_sound = pygame.mixer.Sound("assets/miss.wav")
+                self.miss_sound.set_volume(0.4)
 
-            # Background music
-            pygame.mixer.music.load("assets/Plants vs Zombies Soundtrack/Loonboon.ogg")
-            pygame.mixer.music.set_volume(0.4)
+                # Background music
+                pygame.mixer.music.load(
+                    "assets/Plants vs Zombies Soundtrack/Loonboon.ogg"
+                )
+                pygame.mixer.music.set_volume(0.4)
 
-            self.sounds_loaded = True
-            print("✓ Audio loaded successfully")
+                self.sounds_loaded = True
+                print("✓ Audio loaded successfully")
 
-        except pygame.error as e:
-            print(f"⚠ Audio files not found — running without audio: {e}")
-            self.sounds_loaded = False
+            except pygame.error as e:
+                print(f"⚠ Audio files not found — running without audio: {e}")
+                self.sounds_loaded = False
 
     def play_music(self):
         """Start background music loop."""
+        if not self.load_attempted:
+            self.load()
+
         if not self.sounds_loaded:
             return
 
@@ -48,14 +65,22 @@ class SoundManager:
         if self.sounds_loaded and self.miss_sound:
             self.miss_sound.play()
 
+    def restart_music(self):
+        """Restart background music from the beginning if it is playing."""
+        if self.sounds_loaded and pygame.mixer.music.get_busy():
+            pygame.mixer.music.play(-1)
+
     def stop_music(self):
         """Stop background music."""
-        pygame.mixer.music.stop()
+        if self.sounds_loaded:
+            pygame.mixer.music.stop()
 
     def pause_music(self):
         """Pause background music."""
-        pygame.mixer.music.pause()
+        if self.sounds_loaded:
+            pygame.mixer.music.pause()
 
     def resume_music(self):
         """Resume paused background music."""
-        pygame.mixer.music.unpause()
+        if self.sounds_loaded:
+            pygame.mixer.music.unpause()
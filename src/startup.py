@@ -0,0 +1,79 @@
+"""Startup phase timing."""
+
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Records how long each startup phase takes.
+
+    Phases may run lazily (fonts, sounds), so they are recorded whenever they
+    happen; the first-frame mark measures total time from process start.
+    Phases that finish after the first frame are reported separately and
+    left out of the phase total.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.first_frame_time = None
+
+    def set_origin(self, origin):
+        """Set the perf_counter value that counts as process start."""
+        self.origin = origin
+
+    def add(self, name, seconds):
+        """Record a phase measured elsewhere."""
+        after_first_frame = self.first_frame_time is not None
+        self.phases.append((name, seconds, after_first_frame))
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def mark_first_frame(self):
+        """Record when the first frame was presented (first call only)."""
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter() - self.origin
+
+    def is_over_budget(self, budget_ms):
+        """Check if the first frame missed the time budget."""
+        return (
+            self.first_frame_time is not None
+            and self.first_frame_time * 1000 > budget_ms
+        )
+
+    def format_report(self, budget_ms=None):
+        """Format the breakdown as printable text."""
+        before = [phase for phase in self.phases if not phase[2]]
+        after = [phase for phase in self.phases if phase[2]]
+
+        lines = ["Startup breakdown:"]
+        for name, seconds, _ in before:
+            lines.append(f"  {name:<20}{seconds * 1000:9.1f} ms")
+
+        total = sum(seconds for _, seconds, _ in before)
+        lines.append(f"  {'total (phases)':<20}{total * 1000:9.1f} ms")
+
+        if self.first_frame_time is not None:
+            first_frame_ms = self.first_frame_time * 1000
+            lines.append(f"  {'first frame':<20}{first_frame_ms:9.1f} ms")
+            if budget_ms is not None:
+                status = "OVER BUDGET" if first_frame_ms > budget_ms else "ok"
+                lines.append(f"  {'budget':<20}{budget_ms:9.1f} ms ({status})")
+
+        if after:
+            lines.append("After first frame:")
+            for name, seconds, _ in after:
+                lines.append(f"  {name:<20}{seconds * 1000:9.1f} ms")
+
+        return "\n".join(lines)
+
+
+# Shared by main and the lazy asset loaders
+startup_timer = StartupTimer()
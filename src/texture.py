@@ -2,6 +2,8 @@
 
 import pygame
 
+from . import const
+
 
 class TextureManager:
     """Manages game textures and sprites."""
@@ -15,14 +17,18 @@ class TextureManager:
         self.background = None
         self.zombie_sprite = None
         self.zombie_sprite_squashed = None
+        self.timer_bar_empty = None
+        self.timer_bar_fills = {}
+        self.ground_tile = None
+        self.hole_sprite = None
 
     def load(self):
         """Load all texture assets."""
         try:
-            # Background
+            # Background (fully opaque, so blitted without per-pixel alpha)
             self.background = pygame.image.load(
                 "assets/backdrop_with_holes.png"
-            ).convert_alpha()
+            ).convert()
 
             # Zombie sprite
             raw_sprite = pygame.image.load("assets/sprite.png").convert_alpha()
@@ -37,12 +43,66 @@ class TextureManager:
                 raw_sprite, (self.ZOMBIE_WIDTH, self.ZOMBIE_SQUASHED_HEIGHT)
             )
 
+            self._build_timer_bars()
+            self._build_board_sprites()
+
             print("✓ Textures loaded successfully")
 
         except pygame.error as e:
             print(f"✗ Error loading textures: {e}")
             raise
 
+    def _build_timer_bars(self):
+        """Pre-render timer bar strips so bars can be drawn with plain blits.
+
+        The empty bar is the background with its border. Each fill strip is a
+        completely filled bar with the border baked in, blitted cropped to the
+        remaining-time width on top of the empty bar.
+        """
+        size = (const.TIMER_BAR_WIDTH, const.TIMER_BAR_HEIGHT)
+
+        self.timer_bar_empty = self._create_timer_bar(size, const.TIMER_BAR_BG_COLOR)
+        self.timer_bar_fills = {
+            color: self._create_timer_bar(size, color)
+            for color in (
+                const.TIMER_BAR_GREEN,
+                const.TIMER_BAR_YELLOW,
+                const.TIMER_BAR_RED,
+            )
+        }
+
+    def _build_board_sprites(self):
+        """Build the ground tile and hole sprite used by generated boards.
+
+        The ground tile is a hole-free horizontal strip of the backdrop
+        (between its first and second row of holes).
+        """
+        self.ground_tile = self.background.subsurface(
+            (0, const.GROUND_TILE_TOP, const.WIDTH, const.GROUND_TILE_HEIGHT)
+        ).copy()
+
+        # Soft-edged hole: concentric ellipses, darker towards the middle
+        width, height = const.HOLE_SIZE
+        self.hole_sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        steps = 6
+        for step in range(steps):
+            inset = step * 2
+            alpha = 80 + step * 175 // (steps - 1)
+            pygame.draw.ellipse(
+                self.hole_sprite,
+                (0, 0, 0, alpha),
+                (inset, inset, width - 2 * inset, height - 2 * inset),
+            )
+        self.hole_sprite = self.hole_sprite.convert_alpha()
+
+    @staticmethod
+    def _create_timer_bar(size, fill_color):
+        """Create a bordered bar surface filled with the given color."""
+        bar = pygame.Surface(size).convert()
+        bar.fill(fill_color)
+        pygame.draw.rect(bar, const.TIMER_BAR_BORDER_COLOR, bar.get_rect(), 1)
+        return bar
+
     def get_zombie_dimensions(self):
         """Get zombie sprite dimensions as (width, height) tuple."""
         return (self.ZOMBIE_WIDTH, self.ZOMBIE_HEIGHT)
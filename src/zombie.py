@@ -49,15 +49,19 @@ class Zombie:
 
 
 class ZombieManager:
-    """Manages all active zombies in the game."""
+    """Manages all active zombies in the game.
+
+    Zombies are stored by hole index in a dict, so per-frame work scales with
+    the number of live zombies rather than the number of holes on the board.
+    """
 
     def __init__(self, num_holes):
         self.num_holes = num_holes
-        self.zombies = [None] * num_holes
+        self.zombies = {}
 
     def spawn(self, hole_index, current_time):
         """Spawn a new zombie in the specified hole."""
-        if self.zombies[hole_index] is not None:
+        if hole_index in self.zombies:
             return False
 
         self.zombies[hole_index] = Zombie(hole_index, current_time)
@@ -65,15 +69,15 @@ class ZombieManager:
 
     def get_zombie(self, hole_index):
         """Get zombie at specified hole index."""
-        return self.zombies[hole_index]
+        return self.zombies.get(hole_index)
 
     def is_hole_occupied(self, hole_index):
         """Check if hole has an active zombie."""
-        return self.zombies[hole_index] is not None
+        return hole_index in self.zombies
 
     def hit_zombie(self, hole_index):
         """Mark zombie as hit if it exists and hasn't been hit yet."""
-        zombie = self.zombies[hole_index]
+        zombie = self.zombies.get(hole_index)
         if zombie and not zombie.is_hit:
             zombie.mark_as_hit()
             return True
@@ -81,11 +85,17 @@ class ZombieManager:
 
     def remove_zombie(self, hole_index):
         """Remove zombie from hole."""
-        self.zombies[hole_index] = None
+        self.zombies.pop(hole_index, None)
+
+    def get_available_holes(self, holes=None):
+        """Get list of hole indices that don't have zombies.
 
-    def get_available_holes(self):
-        """Get list of hole indices that don't have zombies."""
-        return [i for i in range(self.num_holes) if not self.is_hole_occupied(i)]
+        Args:
+            holes: Candidate hole indices (default: every hole)
+        """
+        if holes is None:
+            holes = range(self.num_holes)
+        return [i for i in holes if i not in self.zombies]
 
     def update(self, current_time, show_duration):
         """Update all zombies, removing those that should be cleaned up.
@@ -95,11 +105,7 @@ class ZombieManager:
         """
         timeouts = 0
 
-        for i in range(self.num_holes):
-            zombie = self.zombies[i]
-            if zombie is None:
-                continue
-
+        for i, zombie in list(self.zombies.items()):
             # Check for timeout (zombie escaped)
             if zombie.should_timeout(current_time, show_duration):
                 self.remove_zombie(i)
@@ -113,4 +119,4 @@ class ZombieManager:
 
     def reset(self):
         """Clear all zombies."""
-        self.zombies = [None] * self.num_holes
+        self.zombies = {}
@@ -0,0 +1,143 @@
+"""Reaction time analytics: running stats, t-digest sketch and stats file."""
+
+import bisect
+import json
+import random
+import statistics
+import threading
+
+import pytest
+
+from src.analytics import (
+    QuantileSketch,
+    ReactionStats,
+    RunningStats,
+    load_stats,
+    record_session,
+)
+
+
+def _samples(count, seed):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(6, 0.4) for _ in range(count)]
+
+
+def _rank_error(ordered, q, estimate):
+    """Get how far the estimate's rank among the samples is from q."""
+    return abs(bisect.bisect(ordered, estimate) / len(ordered) - q)
+
+
+def test_running_stats_merge_matches_direct_computation():
+    values = _samples(1000, seed=1)
+    left, right = RunningStats(), RunningStats()
+    for value in values[:300]:
+        left.add(value)
+    for value in values[300:]:
+        right.add(value)
+    left.merge(right)
+
+    assert left.count == len(values)
+    assert left.mean == pytest.approx(statistics.fmean(values))
+    assert left.get_variance() == pytest.approx(statistics.variance(values))
+    assert left.min == min(values)
+    assert left.max == max(values)
+
+
+def test_running_stats_merge_with_empty():
+    stats = RunningStats()
+    stats.add(5.0)
+    stats.merge(RunningStats())
+    empty = RunningStats()
+    empty.merge(stats)
+
+    assert (stats.count, stats.mean) == (1, 5.0)
+    assert (empty.count, empty.mean, empty.min, empty.max) == (1, 5.0, 5.0, 5.0)
+
+
+@pytest.mark.parametrize("count", [1_000, 20_000, 200_000])
+def test_sketch_stays_bounded_and_accurate(count):
+    values = _samples(count, seed=count)
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99):
+        assert _rank_error(ordered, q, sketch.get_quantile(q)) < 0.01
+    assert len(sketch.means) <= sketch.compression
+    assert sketch.get_quantile(0.0) == ordered[0]
+    assert sketch.get_quantile(1.0) == ordered[-1]
+
+
+def test_sketch_merge_matches_single_sketch():
+    values = _samples(60_000, seed=2)
+    parts = [QuantileSketch() for _ in range(6)]
+    for i, value in enumerate(values):
+        parts[i % len(parts)].add(value)
+
+    merged = QuantileSketch()
+    for part in parts:
+        merged.merge(part)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99):
+        assert _rank_error(ordered, q, merged.get_quantile(q)) < 0.01
+    assert sum(merged.weights) == len(values)
+    assert len(merged.means) <= merged.compression
+
+
+def test_empty_sketch_has_no_quantiles():
+    assert QuantileSketch().get_quantile(0.5) is None
+
+
+def test_reaction_stats_round_trip():
+    reactions = ReactionStats()
+    for i, value in enumerate(_samples(5000, seed=3)):
+        reactions.add(value, level=1 + i % 25, hole_index=i % 7)
+
+    restored = ReactionStats.from_dict(json.loads(json.dumps(reactions.to_dict())))
+
+    assert restored.to_dict() == reactions.to_dict()
+    assert restored.get_percentiles() == reactions.get_percentiles()
+    assert sorted(restored.by_hole) == list(range(7))
+    assert max(restored.by_level) == 20  # Levels above 20 share a bucket
+
+
+def test_record_session_merges_into_file(tmp_path):
+    path = str(tmp_path / "stats.json")
+    reactions = ReactionStats()
+    reactions.add(250.0, level=1, hole_index=0)
+
+    assert record_session(path, reactions)
+    assert record_session(path, reactions)
+    assert load_stats(path).overall.stats.count == 2
+
+
+def test_record_session_leaves_corrupt_file_alone(tmp_path, capsys):
+    path = tmp_path / "stats.json"
+    path.write_text('{"overall": ')
+    reactions = ReactionStats()
+    reactions.add(250.0, level=1, hole_index=0)
+
+    assert not record_session(str(path), reactions)
+    assert path.read_text() == '{"overall": '
+    assert "Warning" in capsys.readouterr().out
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_record_session_keeps_concurrent_sessions(tmp_path):
+    path = str(tmp_path / "stats.json")
+    reactions = ReactionStats()
+    reactions.add(250.0, level=1, hole_index=0)
+
+    def write_sessions():
+        for _ in range(25):
+            record_session(path, reactions)
+
+    writers = [threading.Thread(target=write_sessions) for _ in range(8)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    assert load_stats(path).overall.stats.count == 200
@@ -0,0 +1,50 @@
+"""Asset cache: shared loading, refcounts and dependencies."""
+
+from src.assets import AssetCache
+
+
+def _make_cache(loads):
+    def load_fonts():
+        loads.append("fonts")
+        return "fonts"
+
+    def load_effects(fonts):
+        loads.append("effects")
+        return ("effects", fonts)
+
+    return AssetCache(
+        loaders={"fonts": load_fonts, "effects": load_effects},
+        dependencies={"effects": ("fonts",)},
+    )
+
+
+def test_assets_load_once_and_unload_after_last_release():
+    loads = []
+    cache = _make_cache(loads)
+
+    assert cache.acquire("fonts") is cache.acquire("fonts")
+    cache.release("fonts")
+    assert cache.get_refcount("fonts") == 1
+    cache.release("fonts")
+    assert cache.get_refcount("fonts") == 0
+
+    cache.acquire("fonts")
+    assert loads == ["fonts", "fonts"]
+
+
+def test_dependency_is_shared_and_held_while_dependent_is_loaded():
+    loads = []
+    cache = _make_cache(loads)
+
+    fonts = cache.acquire("fonts")
+    assert cache.acquire("effects") == ("effects", fonts)
+    cache.acquire("effects")
+    assert loads == ["fonts", "effects"]
+    assert cache.get_refcount("fonts") == 2
+
+    cache.release("fonts")
+    assert cache.get_refcount("fonts") == 1
+    cache.release("effects")
+    cache.release("effects")
+    assert cache.get_refcount("fonts") == 0
+    assert cache.get_refcount("effects") == 0
@@ -0,0 +1,31 @@
+"""Golden-image render regression check (see src/golden.py)."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from src import const, golden  # noqa: E402
+from src.texture import TextureManager  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def display():
+    pygame.display.init()
+    screen = pygame.display.set_mode((const.WIDTH, const.HEIGHT))
+    textures = TextureManager()
+    textures.load()
+    yield screen, textures
+    pygame.quit()
+
+
+@pytest.mark.parametrize(
+    "scenario", golden.SCENARIOS, ids=[scenario.name for scenario in golden.SCENARIOS]
+)
+def test_scenario_matches_golden_images(display, scenario):
+    screen, textures = display
+    failures = golden.check([scenario], screen, textures)
+    assert failures == 0, f"{failures} frames differ; see {golden.REPORT_DIR}"
@@ -0,0 +1,90 @@
+"""Adaptive quality: stepping down under load and back up with headroom."""
+
+from src import const
+from src.quality import QualityGovernor
+
+BUDGET = const.FRAME_BUDGET_MS
+OVERLOAD = BUDGET * (const.QUALITY_DOWN_THRESHOLD + 0.01)
+NEAR_LIMIT = BUDGET * (const.QUALITY_DOWN_THRESHOLD - 0.01)
+HEADROOM = BUDGET * (const.QUALITY_UP_THRESHOLD - 0.1)
+
+
+def _feed(governor, frame_ms, count):
+    """Add count frames; get the 1-based index of the first level change."""
+    for i in range(1, count + 1):
+        if governor.add_frame(frame_ms):
+            return i
+    return None
+
+
+def _step_down(governor):
+    assert _feed(governor, OVERLOAD, const.QUALITY_WINDOW) == const.QUALITY_WINDOW
+
+
+def test_steps_down_after_a_window_over_threshold():
+    governor = QualityGovernor()
+    _step_down(governor)
+
+    assert governor.level == 1
+    assert governor.get_settings() is const.QUALITY_LEVELS[1]
+
+
+def test_holds_level_just_under_threshold():
+    governor = QualityGovernor()
+
+    assert _feed(governor, NEAR_LIMIT, 10 * const.QUALITY_WINDOW) is None
+    assert governor.level == 0
+
+
+def test_stops_at_last_level():
+    governor = QualityGovernor()
+    for _ in range(len(const.QUALITY_LEVELS) - 1):
+        _step_down(governor)
+
+    assert _feed(governor, OVERLOAD, 10 * const.QUALITY_WINDOW) is None
+    assert governor.level == len(const.QUALITY_LEVELS) - 1
+
+
+def test_waits_upgrade_delay_before_stepping_up():
+    governor = QualityGovernor()
+    _step_down(governor)
+
+    changed_at = _feed(governor, HEADROOM, 10 * const.QUALITY_UPGRADE_DELAY)
+
+    assert changed_at == const.QUALITY_UPGRADE_DELAY
+    assert governor.level == 0
+
+
+def test_unsustained_upgrade_doubles_delay():
+    governor = QualityGovernor()
+    _step_down(governor)
+    _feed(governor, HEADROOM, const.QUALITY_UPGRADE_DELAY)
+
+    # The upgrade runs over budget straight away
+    _step_down(governor)
+
+    delay = 2 * const.QUALITY_UPGRADE_DELAY
+    assert governor.upgrade_delay == delay
+    assert _feed(governor, HEADROOM, 10 * delay) == delay
+
+
+def test_sustained_upgrade_keeps_delay():
+    governor = QualityGovernor()
+    _step_down(governor)
+    _feed(governor, HEADROOM, const.QUALITY_UPGRADE_DELAY)
+
+    # Overload only once the upgrade has held for the full delay
+    _feed(governor, NEAR_LIMIT, const.QUALITY_UPGRADE_DELAY)
+    assert _feed(governor, OVERLOAD, const.QUALITY_WINDOW)
+
+    assert governor.level == 1
+    assert governor.upgrade_delay == const.QUALITY_UPGRADE_DELAY
+
+
+def test_upgrade_delay_is_capped():
+    governor = QualityGovernor()
+    for _ in range(12):
+        _step_down(governor)
+        _feed(governor, HEADROOM, governor.upgrade_delay)
+
+    assert governor.upgrade_delay == const.QUALITY_MAX_UPGRADE_DELAY